@@ -1,2 +1,3 @@
-from .get_positions import get_positions
-from .fen_extractor import get_fen_from_position
\ No newline at end of file
+from .get_positions import get_positions, get_positions_batch
+from .fen_extractor import get_fen_from_position
+from .board_hash import board_region_hash
\ No newline at end of file
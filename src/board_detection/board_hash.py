@@ -0,0 +1,17 @@
+import hashlib
+import numpy as np
+
+
+def board_region_hash(image, board_box, stride=4):
+    """
+    Fingerprint the board area of an image (PIL image or H x W x C array), sampling every stride-th pixel.
+    Only the board is hashed, so clocks or hover effects elsewhere on screen don't change it.
+    """
+    x, y, w, h = (int(v) for v in board_box[:4])
+    left, top, right, bottom = max(x, 0), max(y, 0), max(x + w, 0), max(y + h, 0)
+    if isinstance(image, np.ndarray):
+        region = image[top:bottom:stride, left:right:stride]
+    else:
+        # Crop before converting, so a full-screen PIL image isn't copied for a board-sized hash
+        region = np.asarray(image.crop((left, top, right, bottom)))[::stride, ::stride]
+    return hashlib.blake2b(np.ascontiguousarray(region).tobytes(), digest_size=16).digest()
@@ -1,89 +1,74 @@
 import logging
+import numpy as np
 from .get_positions import get_positions
 
 # Logger setup
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Mapping from class_id to FEN characters
+CLASS_TO_FEN = {
+    0: 'p',
+    1: 'r',
+    2: 'n',
+    3: 'b',
+    4: 'q',
+    5: 'k',
+    6: 'P',
+    7: 'R',
+    8: 'N',
+    9: 'B',
+    10: 'Q',
+    11: 'K',
+}
+
 def get_fen_from_position(color, boxes):
     logger.debug(f"Processing {len(boxes)} detected boxes")
     
+    # One array for all class and position filters below
+    arr = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+    class_ids = arr[:, 5]
+    
     # Find the chessboard (class_id 12.0)
-    chessboard_boxes = [box for box in boxes if box[5] == 12.0]
+    board_rows = np.flatnonzero(class_ids == 12.0)
     
-    detected_classes = set([box[5] for box in boxes])
-    logger.debug(f"Detected class IDs: {detected_classes}")
+    logger.debug(f"Detected class IDs: {set(np.unique(class_ids).tolist())}")
     
-    if not chessboard_boxes:
+    if board_rows.size == 0:
         logger.warning("Error: No chessboard detected (class_id 12.0 not found)")
         logger.debug(f"Available boxes: {boxes[:5]}...")  # Log first 5 boxes
         return None
-        
-    chessboard_box = chessboard_boxes[0]
+    
+    chessboard_box = boxes[board_rows[0]]
     logger.debug(f"Chessboard found at: x={chessboard_box[0]}, y={chessboard_box[1]}, size={chessboard_box[2]}")
     
     chessboard_x = chessboard_box[0]
     chessboard_y = chessboard_box[1]
     square_size = chessboard_box[2] / 8.0  # Calculate square size based on chessboard width
 
-    # Mapping from class_id to FEN characters
-    class_to_fen = {
-        0: 'p',
-        1: 'r',
-        2: 'n',
-        3: 'b',
-        4: 'q',
-        5: 'k',
-        6: 'P',
-        7: 'R',
-        8: 'N',
-        9: 'B',
-        10: 'Q',
-        11: 'K',
-    }
-
-    # Filter out the chessboard and process other detections
-    filtered_boxes = [box for box in boxes if box[5] != 12.0]
-
-    # Initialize an 8x8 grid to represent the board
-    grid = [[None for _ in range(8)] for _ in range(8)]
+    # Filter out the chessboard and locate the other detections, all at once
+    pieces = arr[class_ids != 12.0]
+    # Convert center coordinates to chessboard-relative square indices
+    file_indices = np.floor_divide(pieces[:, 0] + pieces[:, 2] / 2 - chessboard_x, square_size)
+    row_indices = np.floor_divide(pieces[:, 1] + pieces[:, 3] / 2 - chessboard_y, square_size)
+    # Check if indices are within bounds
+    on_board = (file_indices >= 0) & (file_indices < 8) & (row_indices >= 0) & (row_indices < 8)
 
-    for box in filtered_boxes:
-        x, y, w, h, confidence, class_id = box
-        # Calculate center coordinates of the piece
-        center_x = x + w / 2
-        center_y = y + h / 2
-        # Convert to chessboard-relative coordinates
-        rel_x = center_x - chessboard_x
-        rel_y = center_y - chessboard_y
-        # Determine file and rank indices
-        file_index = int(rel_x // square_size)
-        row_index = int(rel_y // square_size)
-        # Check if indices are within bounds
-        if 0 <= file_index < 8 and 0 <= row_index < 8:
-            fen_char = class_to_fen.get(int(class_id), '?')  # Use '?' if class_id is unknown
-            # Place the piece in the grid (row_index corresponds to chess rank)
-            grid[row_index][file_index] = fen_char
+    # Flat 64-square board, rank 8 first; empty squares are '1' until runs are counted
+    squares = ['1'] * 64
 
-    # Convert the grid to FEN notation
-    fen_rows = []
-    for row in grid:
-        fen_part = []
-        empty = 0
-        for cell in row:
-            if cell is None:
-                empty += 1
-            else:
-                if empty > 0:
-                    fen_part.append(str(empty))
-                    empty = 0
-                fen_part.append(cell)
-        if empty > 0:
-            fen_part.append(str(empty))
-        fen_rows.append(''.join(fen_part))
+    # Later detections overwrite earlier ones on the same square, as before
+    for square_index, class_id in zip(
+        (row_indices[on_board] * 8 + file_indices[on_board]).astype(int).tolist(),
+        pieces[on_board, 5].astype(int).tolist(),
+    ):
+        # Use '?' if class_id is unknown
+        squares[square_index] = CLASS_TO_FEN.get(class_id, '?')
 
-    # FEN starts with rank 8, which is the first row in our grid
-    fen_piece_placement = '/'.join(fen_rows)
+    # Convert the board to FEN notation, merging runs of empty squares longest first
+    fen_piece_placement = '/'.join(''.join(squares[start:start + 8]) for start in range(0, 64, 8))
+    for run_length in range(8, 1, -1):
+        fen_piece_placement = fen_piece_placement.replace('1' * run_length, str(run_length))
     # Complete FEN string with default values for other fields
     fen = f"{fen_piece_placement} {color} - - 0 1"
 
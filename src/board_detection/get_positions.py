@@ -2,9 +2,12 @@ import numpy as np
 import onnxruntime as ort
 from PIL import Image
 from utils.resource_path import resource_path
+from .board_hash import board_region_hash
 import sys
 import os
 import logging
+import threading
+from collections import OrderedDict
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -19,13 +22,35 @@ if not os.path.exists(model_path):
     )
     sys.exit(1)
 
-# Load the ONNX model from the correct path
-session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+# Load the ONNX model from the correct path, once; every detection reuses this session
+session_options = ort.SessionOptions()
+session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+session_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+# DirectML is only present in the onnxruntime-directml build on Windows
+providers = [
+    provider for provider in ("DmlExecutionProvider", "CPUExecutionProvider")
+    if provider in ort.get_available_providers()
+]
+session = ort.InferenceSession(model_path, session_options, providers=providers)
 input_name = session.get_inputs()[0].name
 output_name = session.get_outputs()[0].name
+# Models exported with a fixed batch of 1 report an int here; dynamic axes report a name
+batch_supported = not isinstance(session.get_inputs()[0].shape[0], int)
 
 conf = 0.5  # Lowered from 0.7 to detect boards more reliably
 
+INPUT_SIZE = 640
+
+# Input tensor reused by predict() so polling loops don't allocate a new one per frame
+_input_buffer = np.empty((1, 3, INPUT_SIZE, INPUT_SIZE), dtype=np.float32)
+_input_lock = threading.Lock()
+
+# Detections for the last few screenshots, keyed by where the board was and a hash of
+# its pixels, so re-analyzing an unchanged board (verify, then the next move) skips inference
+DETECTION_CACHE_SIZE = 8
+_detection_cache = OrderedDict()
+_detection_cache_lock = threading.Lock()
+
 def letterbox_resize(image, target_size):
     """
     Resizes the image to fit within the target_size, maintaining the aspect ratio.
@@ -47,48 +72,125 @@ def letterbox_resize(image, target_size):
 
     return padded, x_offset, y_offset, scale
 
-def preprocess_image(image):
+def preprocess_image(image, out=None):
     """
     Prepares the image for model inference by resizing, normalizing, and formatting.
+    If out is given (shape (1, 3, 640, 640), float32) the tensor is written into it.
     """
-    image, x_offset, y_offset, scale = letterbox_resize(image, 640)
-    image = np.array(image).astype(np.float32) / 255.0  # Normalize
-    image = image.transpose(2, 0, 1)  # HWC to CHW
-    image = np.expand_dims(image, axis=0)  # Add batch dimension
-    return image, x_offset, y_offset, scale
-
-def scale_bbox(detection, x_offset, y_offset, scale):
+    image, x_offset, y_offset, scale = letterbox_resize(image, INPUT_SIZE)
+    if out is None:
+        out = np.empty((1, 3, INPUT_SIZE, INPUT_SIZE), dtype=np.float32)
+    # HWC to CHW and normalize straight into the (batched) tensor
+    np.divide(np.asarray(image).transpose(2, 0, 1), 255.0, out=out[0], dtype=np.float32)
+    return out, x_offset, y_offset, scale
+
+def scale_bboxes(detections, x_offset, y_offset, scale):
     """
-    Scales bounding box coordinates from padded/resized image to original image dimensions.
+    Scales bounding box coordinates of all detections at once from the
+    padded/resized image to original image dimensions.
     """
-    x, y, w, h = detection[:4]
-    new_x = int((x - x_offset) / scale)
-    new_y = int((y - y_offset) / scale)
-    new_w = int((w - x) / scale)  # Width in original dimensions
-    new_h = int((h - y) / scale)  # Height in original dimensions
+    x, y, w, h = detections[:, 0], detections[:, 1], detections[:, 2], detections[:, 3]
     
-    scaled = detection.copy()
-    scaled[:4] = [new_x, new_y, new_w, new_h]
+    scaled = detections.copy()
+    scaled[:, 0] = np.trunc((x - x_offset) / scale)
+    scaled[:, 1] = np.trunc((y - y_offset) / scale)
+    scaled[:, 2] = np.trunc((w - x) / scale)  # Width in original dimensions
+    scaled[:, 3] = np.trunc((h - y) / scale)  # Height in original dimensions
     return scaled
 
-def predict(image):
+def postprocess(output, x_offset, y_offset, scale):
     """
-    Runs model inference and returns processed detections.
+    Turns the raw model output for one image into detections in original image coordinates.
     """
-    img_array, x_offset, y_offset, scale = preprocess_image(image)
-    output = session.run([output_name], {input_name: img_array})[0]
-    output = np.squeeze(output)
+    output = np.squeeze(output).reshape(-1, 6)
     
-    detections = []
-    for r in output:
-        if r[4] > conf:
-            scaled = scale_bbox(r, x_offset, y_offset, scale)
-            detections.append(scaled.tolist())
+    # Confidence filter and rescale as whole-array operations
+    kept = output[output[:, 4] > conf]
+    detections = scale_bboxes(kept, x_offset, y_offset, scale).tolist()
     
     logger.debug(f"Detected {len(detections)} objects with confidence > {conf}")
     
     return detections
 
+def predict(image):
+    """
+    Runs model inference and returns processed detections.
+    """
+    with _input_lock:
+        img_array, x_offset, y_offset, scale = preprocess_image(image, out=_input_buffer)
+        output = session.run([output_name], {input_name: img_array})[0]
+    return postprocess(output, x_offset, y_offset, scale)
+
+def predict_batch(images):
+    """
+    Runs model inference on several images, in a single session.run call when the model
+    accepts a batch dimension, and returns processed detections per image.
+    """
+    batch = np.empty((len(images), 3, INPUT_SIZE, INPUT_SIZE), dtype=np.float32)
+    prepared = [preprocess_image(image, out=batch[i:i + 1]) for i, image in enumerate(images)]
+    if batch_supported and len(prepared) > 1:
+        outputs = session.run([output_name], {input_name: batch})[0]
+    else:
+        outputs = [session.run([output_name], {input_name: img_array})[0] for img_array, _, _, _ in prepared]
+    
+    return [
+        postprocess(output, x_offset, y_offset, scale)
+        for output, (_, x_offset, y_offset, scale) in zip(outputs, prepared)
+    ]
+
+# Class id the model gives the chessboard itself
+CHESSBOARD_CLASS = 12.0
+
+def _board_box(predictions):
+    """
+    Integer x, y, w, h of the detected chessboard, or None if there is none.
+    """
+    board = next((box for box in predictions if box[5] == CHESSBOARD_CLASS), None)
+    if board is None:
+        return None
+    return tuple(int(v) for v in board[:4])
+
+def _on_board(predictions, board_box):
+    """
+    The detections whose centers fall inside board_box, the board itself included.
+    """
+    x, y, w, h = board_box
+    return [
+        list(box) for box in predictions
+        if x <= box[0] + box[2] / 2 < x + w and y <= box[1] + box[3] / 2 < y + h
+    ]
+
+def _cached_predict(image):
+    """
+    predict() with a small LRU cache in front of it, keyed by the board area of earlier screenshots.
+    Only the board is hashed, so a cache hit returns just the detections on the board;
+    anything off it may have changed since. Callers get their own copy of the detections.
+    """
+    with _detection_cache_lock:
+        entries = list(_detection_cache.items())
+
+    for key, (region_hash, predictions) in reversed(entries):
+        mode, size, board_box = key
+        if mode != image.mode or size != image.size:
+            continue
+        if board_region_hash(image, board_box) == region_hash:
+            with _detection_cache_lock:
+                if key in _detection_cache:
+                    _detection_cache.move_to_end(key)
+            logger.debug("Board unchanged, reusing cached detections")
+            return [list(box) for box in predictions]
+
+    predictions = predict(image)
+    board_box = _board_box(predictions)
+    if board_box is not None:
+        entry = (board_region_hash(image, board_box), _on_board(predictions, board_box))
+        with _detection_cache_lock:
+            _detection_cache[(image.mode, image.size, board_box)] = entry
+            _detection_cache.move_to_end((image.mode, image.size, board_box))
+            if len(_detection_cache) > DETECTION_CACHE_SIZE:
+                _detection_cache.popitem(last=False)
+    return predictions
+
 def get_positions(image_input):
     """
     Handles image loading and executes prediction.
@@ -102,9 +204,18 @@ def get_positions(image_input):
         logger.warning(f"Error loading image: {e}")
         return []
 
-    predictions = predict(image)
+    predictions = _cached_predict(image)
     return predictions if predictions else None
 
+def get_positions_batch(images):
+    """
+    Executes prediction for several already-loaded images at once.
+    Returns one entry per image, None where nothing was detected.
+    """
+    if not images:
+        return []
+    return [predictions if predictions else None for predictions in predict_batch(images)]
+
 if __name__ == "__main__":
     image_path = "screenshot.png"
     print(get_positions(image_path))
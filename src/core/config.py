@@ -27,6 +27,40 @@ class AppConfig:
     # Maximum consecutive failures before auto mode stops
     MAX_CONSECUTIVE_FAILURES = 3
     
+    # Upper bound on waiting for the move animation after click / drag moves (seconds)
+    CLICK_MOVE_SETTLE_DELAY = 0.4
+    DRAG_MOVE_SETTLE_DELAY = 0.1
+    
+    # Interval between square checks while waiting for the animation (seconds)
+    MOVE_SETTLE_POLL_INTERVAL = 0.02
+    
+    # Back-off bounds while polling for a played move to show up (seconds)
+    VERIFY_INITIAL_BACKOFF = 0.02
+    VERIFY_MAX_BACKOFF = 0.15
+    
+    # First pause while waiting for the promotion dialog; grows up to the caller's interval (seconds)
+    PROMOTION_POLL_INITIAL_INTERVAL = 0.05
+    
+    # Screenshots taken per promotion dialog check, run through the model as one batch
+    # (one screenshot when the model has a fixed batch size)
+    PROMOTION_FRAMES_PER_BATCH = 2
+    
+    # Time budget for a search: base + per requested depth (seconds)
+    ENGINE_BASE_TIMEOUT = 10.0
+    ENGINE_TIMEOUT_PER_DEPTH = 2.0
+    
+    # Minimum time between "Depth x/y" status updates during a search (seconds)
+    ENGINE_STATUS_UPDATE_INTERVAL = 0.1
+    
+    # How long to wait for short engine replies (readyok, stop, d) (seconds)
+    ENGINE_RESPONSE_TIMEOUT = 5.0
+    
+    # Let the engine search the expected reply while the opponent is thinking
+    ENGINE_PONDER = True
+    
+    # Oldest board capture a castling attempt reuses instead of taking a new one (seconds)
+    CASTLING_FEN_MAX_AGE = 10.0
+    
     # Skip verification if it fails (continue with move execution)
     SKIP_VERIFICATION_ON_FAILURE = True
     
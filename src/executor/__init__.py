@@ -11,9 +11,10 @@ from .process_move import process_move
 from .store_board_positions import store_board_positions
 from .verify_move import verify_move
 from .auto_move import auto_move_loop
-from .get_best_move import get_best_move, cleanup_stockfish, initialize_stockfish_at_startup
+from .get_best_move import get_best_move, cleanup_stockfish, initialize_stockfish_at_startup, reset_engine
 from .get_current_fen import get_current_fen
 from .is_two_square_king_move import is_two_square_king_move
+from .apply_uci_move import apply_uci_move
 
 __all__ = [
     "capture_screenshot_in_memory",
@@ -32,6 +33,8 @@ __all__ = [
     "get_best_move",
     "get_current_fen",
     "is_two_square_king_move",
+    "apply_uci_move",
     "cleanup_stockfish",
     "initialize_stockfish_at_startup",
+    "reset_engine",
 ]
@@ -0,0 +1,107 @@
+from executor.expend_fen_row import expend_fen_row
+import logging
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+FILES = "abcdefgh"
+
+# Castling right lost when a piece leaves from / is captured on this square
+_CASTLING_SQUARES = {"e1": "KQ", "h1": "K", "a1": "Q", "e8": "kq", "h8": "k", "a8": "q"}
+
+
+def apply_uci_move(fen, move):
+    """
+    Play a UCI move (e.g. 'e2e4', 'e7e8q') on a FEN and return the resulting FEN.
+    Raises ValueError if the FEN or move cannot be applied.
+    """
+    fields = fen.split()
+    if len(fields) < 4 or len(move) not in (4, 5):
+        raise ValueError(f"Cannot apply move {move} to FEN {fen}")
+
+    rows = fields[0].split("/")
+    board = [list(expend_fen_row(row)) for row in rows]
+    if len(board) != 8 or any(len(row) != 8 for row in board):
+        raise ValueError(f"Malformed board in FEN: {fen}")
+
+    turn = fields[1]
+    castling = fields[2]
+    halfmove = int(fields[4]) if len(fields) > 4 else 0
+    fullmove = int(fields[5]) if len(fields) > 5 else 1
+
+    start, end = move[:2], move[2:4]
+    start_col, start_row = _square_to_index(start)
+    end_col, end_row = _square_to_index(end)
+
+    piece = board[start_row][start_col]
+    if piece == " ":
+        raise ValueError(f"No piece on {start} for move {move}")
+    captured = board[end_row][end_col]
+
+    board[start_row][start_col] = " "
+    board[end_row][end_col] = piece
+
+    ep_square = "-"
+    if piece in "Pp":
+        # En passant capture removes the pawn behind the target square
+        if end == fields[3] and start_col != end_col and captured == " ":
+            board[start_row][end_col] = " "
+            captured = "p" if piece == "P" else "P"
+        if abs(end_row - start_row) == 2:
+            ep_square = f"{start[0]}{(int(start[1]) + int(end[1])) // 2}"
+        if len(move) == 5:
+            promo = move[4]
+            board[end_row][end_col] = promo.upper() if piece == "P" else promo.lower()
+    elif piece in "Kk" and abs(end_col - start_col) == 2:
+        # Castling: the rook jumps over the king
+        rook_from, rook_to = (7, 5) if end_col > start_col else (0, 3)
+        board[start_row][rook_to] = board[start_row][rook_from]
+        board[start_row][rook_from] = " "
+
+    for square in (start, end):
+        for right in _CASTLING_SQUARES.get(square, ""):
+            castling = castling.replace(right, "")
+
+    halfmove = 0 if piece in "Pp" or captured != " " else halfmove + 1
+    if turn == "b":
+        fullmove += 1
+
+    updated_fen = " ".join([
+        "/".join(_compress_row(row) for row in board),
+        "b" if turn == "w" else "w",
+        castling or "-",
+        ep_square,
+        str(halfmove),
+        str(fullmove),
+    ])
+    logger.debug("Applied %s: %s", move, updated_fen)
+    return updated_fen
+
+
+def _square_to_index(square):
+    """
+    Convert algebraic square (e.g. 'e4') to (col, row) with row 0 being rank 8.
+    """
+    col = FILES.find(square[0])
+    if col < 0 or square[1] not in "12345678":
+        raise ValueError(f"Invalid square: {square}")
+    return col, 8 - int(square[1])
+
+
+def _compress_row(row):
+    """
+    Turn an expanded row back into FEN notation.
+    """
+    result = ""
+    empty = 0
+    for char in row:
+        if char == " ":
+            empty += 1
+            continue
+        if empty:
+            result += str(empty)
+            empty = 0
+        result += char
+    if empty:
+        result += str(empty)
+    return result
@@ -3,7 +3,7 @@ import threading
 import logging
 
 from board_detection import get_positions, get_fen_from_position
-from executor.capture_screenshot_in_memory import capture_screenshot_in_memory
+from executor.capture_screenshot_in_memory import capture_screenshot_in_memory, release_screen_capture
 from executor.process_move import process_move
 from executor.processing_sync import processing_event
 from core.config import AppConfig
@@ -158,15 +158,19 @@ def auto_move_loop(
     opp_color = 'b' if color_indicator == 'w' else 'w'
     logger.info(f"Player color: {color_indicator}, Opponent color: {opp_color}")
 
-    # Initialize with seed position
-    _perform_initial_seeding(root, auto_mode_var, color_indicator, last_fen_by_color)
-    
-    # Main processing loop
-    _run_move_detection_loop(
-        root, color_indicator, opp_color, auto_mode_var, btn_play, move_mode,
-        board_positions, last_fen_by_color, screenshot_delay_var,
-        update_status_callback, kingside_var, queenside_var, update_last_fen_for_color
-    )
+    try:
+        # Initialize with seed position
+        _perform_initial_seeding(root, auto_mode_var, color_indicator, last_fen_by_color)
+        
+        # Main processing loop
+        _run_move_detection_loop(
+            root, color_indicator, opp_color, auto_mode_var, btn_play, move_mode,
+            board_positions, last_fen_by_color, screenshot_delay_var,
+            update_status_callback, kingside_var, queenside_var, update_last_fen_for_color
+        )
+    finally:
+        # The loop runs on its own thread; close its screen capture connection on the way out
+        release_screen_capture()
     
     logger.info("Exiting auto_move_loop")
 
@@ -8,10 +8,41 @@ from PyQt6.QtCore import QTimer
 import logging
 from utils.get_binary_path import get_binary_path
 import os
+import threading
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# One mss instance per thread: opening it connects to the display server,
+# and instances must not be shared across threads
+_local = threading.local()
+
+
+def _get_mss():
+    sct = getattr(_local, "sct", None)
+    if sct is None:
+        sct = _local.sct = mss.mss()
+    return sct
+
+
+def _reset_mss():
+    sct = getattr(_local, "sct", None)
+    _local.sct = None
+    if sct is not None:
+        try:
+            sct.close()
+        except Exception:
+            logger.debug("Could not close mss instance", exc_info=True)
+
+
+def release_screen_capture():
+    """
+    Close the calling thread's mss instance. mss keeps its display connection
+    (X11) or device context (GDI) open until closed, so every thread that
+    captures calls this before it exits.
+    """
+    _reset_mss()
+
 
 def capture_screenshot_in_memory(root=None, auto_mode_var=None):
     grim_path = get_binary_path("grim") if is_wayland() else None
@@ -23,10 +54,16 @@ def capture_screenshot_in_memory(root=None, auto_mode_var=None):
             image = Image.open(io.BytesIO(result.stdout))
         else:
             logger.info("Capturing screenshot using mss (non-Wayland)...")
-            with mss.mss() as sct:
-                monitor = sct.monitors[1]
-                sct_img = sct.grab(monitor)
-                image = Image.frombytes("RGB", sct_img.size, sct_img.rgb)
+            try:
+                sct = _get_mss()
+                sct_img = sct.grab(sct.monitors[1])
+            except Exception:
+                # Display connection may be stale; retry once on a fresh instance
+                _reset_mss()
+                sct = _get_mss()
+                sct_img = sct.grab(sct.monitors[1])
+            # Decode BGRA straight into an RGB image: one copy instead of building .rgb first
+            image = Image.frombuffer("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
         logger.debug("Screenshot captured successfully")
         return image
     except Exception as e:
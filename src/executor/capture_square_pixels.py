@@ -0,0 +1,34 @@
+import logging
+from .is_wayland import is_wayland
+from .capture_screenshot_in_memory import _get_mss, _reset_mss
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+# Polled every few tens of milliseconds, so decide the session type once
+_IS_WAYLAND = is_wayland()
+
+
+def capture_square_pixels(center, half_size):
+    """
+    Grab the raw RGB bytes of a small square around center (screen coordinates).
+    Returns None on Wayland or on failure, where callers should fall back to a fixed delay.
+    """
+    if _IS_WAYLAND:
+        return None
+    try:
+        # Same per-thread mss instance as full screenshots, instead of reconnecting per grab
+        sct = _get_mss()
+        monitor = sct.monitors[1]
+        region = {
+            "left": monitor["left"] + int(center[0]) - half_size,
+            "top": monitor["top"] + int(center[1]) - half_size,
+            "width": 2 * half_size,
+            "height": 2 * half_size,
+        }
+        return sct.grab(region).rgb
+    except Exception as e:
+        logger.debug("Square capture failed: %s", e)
+        # Display connection may be stale; the next grab opens a fresh instance
+        _reset_mss()
+        return None
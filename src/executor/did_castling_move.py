@@ -4,6 +4,11 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Lookup tables indexed by ord(char): 1 if the char is one of that side's pieces
+_WHITE_PIECE = bytes(1 if chr(i) in 'PNBRQK' else 0 for i in range(128))
+_BLACK_PIECE = bytes(1 if chr(i) in 'pnbrqk' else 0 for i in range(128))
+_MY_PIECES = {'w': _WHITE_PIECE, 'b': _BLACK_PIECE}
+
 def did_castling_move(color_indicator, before_fen: str, after_fen: str, king_move: str, rook_move: str) -> bool:
     """
     Verify that a castling move was executed correctly.
@@ -17,28 +22,24 @@ def did_castling_move(color_indicator, before_fen: str, after_fen: str, king_mov
         rook_move: Rook's move in algebraic notation (e.g., 'a1d1')
     
     Returns:
-        True if both pieces moved correctly and nothing else changed
+        True if both pieces moved correctly
     """
     logger.debug(f"Checking castling: King {king_move}, Rook {rook_move} for color: {color_indicator}")
     
     def expand_row(row):
-        out = []
+        out = ''
         for ch in row:
             if ch.isdigit():
-                out += [' '] * int(ch)
+                out += ' ' * int(ch)
             else:
-                out.append(ch)
+                out += ch
         return out
 
-    def fen_to_list(fen):
-        rows = fen.split()[0].split('/')
-        flat = []
-        for r in rows:
-            flat += expand_row(r)
-        return flat  # len=64
+    def fen_to_str(fen):
+        return ''.join(expand_row(r) for r in fen.split()[0].split('/'))  # len=64
 
-    before_list = fen_to_list(before_fen)
-    after_list = fen_to_list(after_fen)
+    before_str = fen_to_str(before_fen)
+    after_str = fen_to_str(after_fen)
 
     def algebraic_to_index(sq):
         file = ord(sq[0]) - ord('a')         # 0..7
@@ -53,39 +54,24 @@ def did_castling_move(color_indicator, before_fen: str, after_fen: str, king_mov
     rook_start_i = algebraic_to_index(rook_move[0:2])
     rook_end_i = algebraic_to_index(rook_move[2:4])
     
-    my_pieces = 'PNBRQK' if color_indicator == 'w' else 'pnbrqk'
-    
-    # Get the pieces that should have moved
-    king_char = before_list[king_start_i]
-    rook_char = before_list[rook_start_i]
-    
-    logger.debug(f"King at start: '{king_char}', Rook at start: '{rook_char}'")
-    
-    # Check king moved correctly
-    king_moved_from = (king_char in my_pieces) and (after_list[king_start_i] == ' ')
-    king_moved_to = (after_list[king_end_i] == king_char)
-    
-    # Check rook moved correctly
-    rook_moved_from = (rook_char in my_pieces) and (after_list[rook_start_i] == ' ')
-    rook_moved_to = (after_list[rook_end_i] == rook_char)
+    my_pieces = _MY_PIECES[color_indicator]
     
-    logger.debug(
-        f"After - King at end: '{after_list[king_end_i]}', Rook at end: '{after_list[rook_end_i]}'"
+    # Pieces that should have moved, and what now stands on their destinations
+    b_k0, b_r0, a_k1, a_r1 = (
+        before_str[king_start_i], before_str[rook_start_i],
+        after_str[king_end_i], after_str[rook_end_i],
     )
     
-    # Check that everything else is unchanged (except the 4 castling squares)
-    # castling_squares = {king_start_i, king_end_i, rook_start_i, rook_end_i}
-    # unchanged_elsewhere = all(
-    #     (b == a) or idx in castling_squares
-    #     for idx, (b, a) in enumerate(zip(before_list, after_list))
-    # )
+    logger.debug(f"King: '{b_k0}' -> '{a_k1}', Rook: '{b_r0}' -> '{a_r1}'")
     
-    logger.debug(
-        f"king_moved_from={king_moved_from}, king_moved_to={king_moved_to}, "
-        f"rook_moved_from={rook_moved_from}, rook_moved_to={rook_moved_to}"
+    # Both pieces are ours, left their start squares, and arrived on their targets
+    castled = (
+        my_pieces[ord(b_k0)] and my_pieces[ord(b_r0)]
+        and after_str[king_start_i] == ' ' and after_str[rook_start_i] == ' '
+        and a_k1 == b_k0 and a_r1 == b_r0
     )
     
-    if king_moved_from and king_moved_to and rook_moved_from and rook_moved_to:
+    if castled:
         logger.info(f"Valid castling detected: King {king_move}, Rook {rook_move}")
         return True
     else:
@@ -2,12 +2,14 @@ import time
 import logging
 from board_detection import get_positions, get_fen_from_position
 from executor.capture_screenshot_in_memory import capture_screenshot_in_memory
+from executor.capture_square_pixels import capture_square_pixels
 from executor.get_current_fen import get_current_fen
 from executor.chess_notation_to_index import chess_notation_to_index
 from executor.move_piece import move_piece
 from executor.did_my_piece_move import did_my_piece_move
 from core.config import AppConfig
 from executor.pawn_promotion import handle_pawn_promotion, is_pawn_promotion_move
+from executor.gui_bridge import stop_auto_mode
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -19,23 +21,12 @@ def _disable_auto_mode(auto_mode_var, root):
     1. Setting the auto_mode_var to False
     2. Unchecking the auto_mode_check checkbox
     3. Re-enabling the play button
+    Runs on the move thread, so the widgets are updated through the GUI bridge.
     """
     try:
         if root is not None:
-            # Set the variable
-            if hasattr(root, "auto_mode_var"):
-                root.auto_mode_var = False
-                logger.info("Set auto_mode_var to False")
-            
-            # Uncheck the checkbox (this is the key fix)
-            if hasattr(root, "auto_mode_check"):
-                root.auto_mode_check.setChecked(False)
-                logger.info("Unchecked auto_mode_check checkbox")
-            
-            # Re-enable the play button
-            if hasattr(root, "btn_play"):
-                root.btn_play.setEnabled(True)
-                logger.info("Re-enabled play button")
+            stop_auto_mode(root, enable_play=True)
+            logger.info("Disabled auto mode and re-enabled play button")
         
         # Also try to set via the auto_mode_var parameter if it has a set method
         if hasattr(auto_mode_var, "set") and callable(auto_mode_var.set):
@@ -110,6 +101,7 @@ def _attempt_single_move(
     move_mode,
 ):
     """Attempt to execute and verify a single move."""
+    is_promotion = is_pawn_promotion_move(move)
     
     # Get board state before move
     original_fen = get_current_fen(color_indicator)
@@ -129,40 +121,32 @@ def _attempt_single_move(
     # Execute the physical move
     _execute_physical_move(
         color_indicator, move, board_positions, 
-        auto_mode_var, root, btn_play, move_mode
+        auto_mode_var, root, btn_play, move_mode,
+        end_pos=move_positions[3]
     )
     
-    if is_pawn_promotion_move(move):
+    board_state = None
+    if is_promotion:
         logger.info(f"Detected pawn promotion move: {move}")
         # Capture current board state to pass to promotion handler
         try:
-            img = capture_screenshot_in_memory()
-            boxes = get_positions(img) if img else None
-            if boxes:
-                chessboard_boxes = [box for box in boxes if box[5] == 12.0]
-                if chessboard_boxes:
-                    result = get_fen_from_position(color_indicator, boxes)
-                    if result:
-                        chessboard_x, chessboard_y, square_size, fen = result
-                        chessboard_data = {
-                            'chessboard_x': chessboard_x,
-                            'chessboard_y': chessboard_y,
-                            'square_size': square_size,
-                            'fen': fen
-                        }
-                        # Handle promotion piece selection
-                        promotion_success = handle_pawn_promotion(
-                            color_indicator, move, board_positions, chessboard_data,
-                            auto_mode_var, root, move_mode, humanize=True, max_retries=2
-                        )
-                        if not promotion_success:
-                            logger.warning("Pawn promotion handling may have failed")
+            board_state = _capture_board_state(color_indicator)
+            if board_state:
+                # Handle promotion piece selection
+                promotion_success = handle_pawn_promotion(
+                    color_indicator, move, board_positions, board_state.chessboard_data,
+                    auto_mode_var, root, move_mode, humanize=True, max_retries=2
+                )
+                if not promotion_success:
+                    logger.warning("Pawn promotion handling may have failed")
         except Exception as e:
             logger.warning(f"Error in promotion handling: {e}")
     
-    # Verify the move was successful
+    # Verify the move was successful, trying the capture above before taking a new one
     verification_result = _verify_move_execution(
-        color_indicator, original_fen, move
+        color_indicator, original_fen, move, root,
+        cached_fen=board_state.fen if board_state else None,
+        is_promotion=is_promotion
     )
     
     if verification_result.verified:
@@ -204,17 +188,44 @@ def _get_move_positions(board_positions, color_indicator, move, root, auto_mode_
 
 def _execute_physical_move(
     color_indicator, move, board_positions,
-    auto_mode_var, root, btn_play, move_mode
+    auto_mode_var, root, btn_play, move_mode, end_pos=None
 ):
     """Execute the physical move on the board."""
+    # Snapshot the destination square so we can tell when the piece has landed there.
+    # The source square is no use: in click mode the selection highlight alone changes it.
+    half_size = _square_half_size(board_positions)
+    before = capture_square_pixels(end_pos, half_size) if end_pos and half_size else None
+    
     move_piece(
         color_indicator, move, board_positions,
         auto_mode_var, root, btn_play, move_mode
     )
     
-    # Wait for move animation to complete
-    delay = 0.4 if move_mode == "click" else 0.1
-    time.sleep(delay)
+    # Wait for move animation to complete, at most the old fixed delay
+    delay = AppConfig.CLICK_MOVE_SETTLE_DELAY if move_mode == "click" else AppConfig.DRAG_MOVE_SETTLE_DELAY
+    if before is None:
+        time.sleep(delay)
+        return
+    
+    deadline = time.monotonic() + delay
+    previous = before
+    while time.monotonic() < deadline:
+        current = capture_square_pixels(end_pos, half_size)
+        # Changed, and the same as the last grab: the piece is there and no longer moving
+        if current is not None and current != before and current == previous:
+            logger.debug("Destination square settled, move has landed")
+            return
+        previous = current
+        time.sleep(AppConfig.MOVE_SETTLE_POLL_INTERVAL)
+
+
+def _square_half_size(board_positions):
+    """Half the width of a square's inner area, from the spacing of stored square centers."""
+    try:
+        size = abs(board_positions[(1, 0)][0] - board_positions[(0, 0)][0])
+    except KeyError:
+        return 0
+    return int(size) // 4
 
 
 class VerificationResult:
@@ -224,55 +235,109 @@ class VerificationResult:
         self.current_fen = current_fen
 
 
-def _verify_move_execution(color_indicator, original_fen, move):
-    """Verify that the move was successfully executed."""
-    is_promotion = is_pawn_promotion_move(move)
+def _verify_move_execution(color_indicator, original_fen, move, root=None, cached_fen=None, is_promotion=None):
+    """
+    Verify that the move was successfully executed.
+    cached_fen, if given, is checked first so a capture already taken
+    after the move does not have to be repeated.
+    """
+    if cached_fen and did_my_piece_move(color_indicator, original_fen, cached_fen, move):
+        logger.info(f"Move executed successfully: {move}")
+        return VerificationResult(verified=True, current_fen=cached_fen)
+    
+    if is_promotion is None:
+        is_promotion = is_pawn_promotion_move(move)
     max_verify_attempts = 4 if is_promotion else 2
-    extra_delay = 0.3 if is_promotion else 0.2
+    extra_delay = 0.3 if is_promotion else 0.2  # Extra delay for promotion moves
     
-    for verify_attempt in range(max_verify_attempts):
-        time.sleep(extra_delay)  # Extra delay for promotion moves
+    # The old fixed per-attempt delays now only bound the total wait
+    deadline = time.monotonic() + max_verify_attempts * extra_delay
+    stop_event = getattr(root, "_stop_event", None)
+    
+    current_fen = _wait_for_board_change(color_indicator, original_fen, move, deadline, stop_event)
+    if current_fen:
+        return VerificationResult(verified=True, current_fen=current_fen)
+    
+    return VerificationResult(verified=False)
+
+
+def _wait_for_board_change(color_indicator, original_fen, move, deadline, stop_event=None):
+    """
+    Poll the board with a doubling back-off until the move registers or the
+    deadline passes. Returns the new FEN on success, None otherwise.
+    A set stop_event (app shutting down) cancels the wait immediately.
+    """
+    backoff = AppConfig.VERIFY_INITIAL_BACKOFF
+    verify_attempt = 0
+    
+    while True:
+        if stop_event is not None:
+            if stop_event.wait(backoff):
+                logger.info("Stop requested; abandoning move verification")
+                return None
+        else:
+            time.sleep(backoff)
+        backoff = min(backoff * 2, AppConfig.VERIFY_MAX_BACKOFF)
         
         current_fen = _capture_and_extract_fen(color_indicator, verify_attempt)
-        if not current_fen:
-            continue
-        
-        logger.debug(f"Checking if move registered: {move}")
-        if did_my_piece_move(color_indicator, original_fen, current_fen, move):
-            logger.info(f"Move executed successfully: {move}")
-            return VerificationResult(verified=True, current_fen=current_fen)
+        if current_fen:
+            logger.debug(f"Checking if move registered: {move}")
+            if did_my_piece_move(color_indicator, original_fen, current_fen, move):
+                logger.info(f"Move executed successfully: {move}")
+                return current_fen
+            
+            logger.debug(f"Move not yet registered on attempt {verify_attempt + 1}")
         
-        logger.debug(f"Move not yet registered on attempt {verify_attempt + 1}")
-    
-    return VerificationResult(verified=False)
+        verify_attempt += 1
+        if time.monotonic() >= deadline:
+            return None
+
+
+class BoardState:
+    """Board detected in a single capture."""
+    def __init__(self, fen, chessboard_data):
+        self.fen = fen
+        self.chessboard_data = chessboard_data
 
 
 def _capture_and_extract_fen(color_indicator, verify_attempt):
     """Capture screenshot and extract FEN from current board state."""
+    board_state = _capture_board_state(color_indicator, verify_attempt)
+    return board_state.fen if board_state else None
+
+
+def _capture_board_state(color_indicator, attempt=0):
+    """
+    Capture a screenshot and run board detection once.
+    Returns a BoardState, or None if any step fails.
+    """
     img = capture_screenshot_in_memory()
     if not img:
-        logger.warning(f"Screenshot failed on verification attempt {verify_attempt + 1}")
+        logger.warning(f"Screenshot failed on capture attempt {attempt + 1}")
         return None
     
     boxes = get_positions(img)
     if not boxes:
-        logger.warning(f"Board detection failed on verification attempt {verify_attempt + 1}")
-        return None
-    
-    if not any(box[5] == 12.0 for box in boxes):
-        logger.warning(f"No chessboard detected on verification attempt {verify_attempt + 1}")
+        logger.warning(f"Board detection failed on capture attempt {attempt + 1}")
         return None
     
+    # get_fen_from_position returns None when no chessboard (class 12) was detected
     try:
         result = get_fen_from_position(color_indicator, boxes)
         if result is None:
-            logger.warning(f"FEN extraction returned None on verification attempt {verify_attempt + 1}")
+            logger.warning(f"FEN extraction returned None on capture attempt {attempt + 1}")
             return None
         
-        _, _, _, current_fen = result
-        return current_fen
+        chessboard_x, chessboard_y, square_size, fen = result
+        chessboard_data = {
+            'chessboard_x': chessboard_x,
+            'chessboard_y': chessboard_y,
+            'square_size': square_size,
+            'fen': fen
+        }
+        return BoardState(fen, chessboard_data)
     except (ValueError, TypeError) as e:
-        logger.warning(f"FEN extraction error on verification attempt {verify_attempt + 1}: {e}")
+        logger.warning(f"FEN extraction error on capture attempt {attempt + 1}: {e}")
         return None
 
 
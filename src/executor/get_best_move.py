@@ -1,18 +1,64 @@
 import os
+import re
+import atexit
+import collections
 import subprocess
 import shutil
 import logging
+import queue
+import threading
+import time
 from PyQt6.QtWidgets import QMessageBox
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
 import sys
 from utils.resource_path import resource_path
+from executor.apply_uci_move import apply_uci_move
+from core.config import AppConfig
 
-# Logger setup
+# Logger setup; the level comes from the app's logging configuration
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# One pass per engine line: groups 1/2 = bestmove and ponder move, group 3 = depth, groups 4/5 = score kind (cp/mate) and value
+_ENGINE_LINE_RE = re.compile(rb"^(?:bestmove (\S+)(?: ponder (\S+))?|info depth (\d+)(?:.*? score (cp|mate) (-?\d+))?)")
 
 # Global Stockfish process
 _stockfish_process = None
+# Resolved binary path, looked up once per session
+_stockfish_path = None
+# Batches of lines read from stdout by a background thread, so reads can time out
+_stockfish_lines = None
+# Lines from the current batch not handed out yet
+_pending_lines = collections.deque()
+# Last position searched, used to tell when a new game has started
+_last_fen = None
+# Placement and side to move of the position being pondered on, None when not pondering
+_ponder_key = None
+# Serializes access to the shared process; re-entrant so cleanup can run from an error path
+_stockfish_lock = threading.RLock()
+
+
+class _GuiBridge(QObject):
+    """Queues error dialogs and auto-mode checkbox updates from the engine caller's thread to the GUI thread."""
+    error_dialog = pyqtSignal(object, str)
+    auto_mode_unchecked = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.error_dialog.connect(self._show_error, Qt.ConnectionType.QueuedConnection)
+        self.auto_mode_unchecked.connect(self._uncheck_auto_mode, Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot(object, str)
+    def _show_error(self, root, message):
+        QMessageBox.critical(root, "Error", message)
+
+    @pyqtSlot(object)
+    def _uncheck_auto_mode(self, root):
+        # Unchecking also re-enables the play button via toggle_auto_mode
+        root.auto_mode_check.setChecked(False)
+
+
+# Created at import, so it lives on the GUI thread and the slots run there
+_gui = _GuiBridge()
 
 def get_root_dir():
     # When bundled by PyInstaller, __file__ doesn't point to the EXE location
@@ -22,6 +68,10 @@ def get_root_dir():
         return os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 CONFIG_FILE = os.path.join(get_root_dir(), "engine_config.txt")
+# Set once the config file has been seen, so moves don't stat it every time
+_config_verified = False
+# (path, mtime, option lines) from the last parse of the config file
+_config_cache = None
 
 def create_default_config(config_path):
     """Creates a default config file with user-friendly comments."""
@@ -38,98 +88,245 @@ def create_default_config(config_path):
         f.write("# CPU threads to use (1-8 usually; match your CPU core count)\n")
         f.write("setoption name Threads value 4\n")
     
-    logger.info(f"Created default config file at {config_path}")
+    logger.info("Created default config file at %s", config_path)
 
 def load_engine_config(stockfish_proc, config_path=CONFIG_FILE):
     """Loads Stockfish engine settings from a config file. Creates default with comments if missing."""
     
+    global _config_cache
+    
     # Always check if config exists and create if missing
-    if not os.path.exists(config_path):
+    try:
+        mtime = os.stat(config_path).st_mtime
+    except FileNotFoundError:
         create_default_config(config_path)
+        mtime = os.stat(config_path).st_mtime
+
+    # Only re-parse the file when it changed since the last load
+    if _config_cache is None or _config_cache[:2] != (config_path, mtime):
+        commands = []
+        with open(config_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                commands.append(f"{line}\n")
+        _config_cache = (config_path, mtime, commands)
+    commands = _config_cache[2]
+    
+    for command in commands:
+        logger.info("Applying engine option: %s", command.strip())
 
-    # Load and apply the config
-    with open(config_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            try:
-                logger.info(f"Applying engine option: {line}")
-                stockfish_proc.stdin.write(f"{line}\n")
-            except Exception as e:
-                logger.warning(f"Failed to apply config line '{line}': {e}")
-
-    stockfish_proc.stdin.write("isready\n")
-    stockfish_proc.stdin.flush()
-    while True:
-        if stockfish_proc.stdout.readline().strip() == "readyok":
-            break
+    # Send the options and isready in a single write
+    _send(stockfish_proc, "".join(commands) + "isready\n")
+    _wait_for_reply(b"readyok", "while loading config")
 
 def ensure_config_exists():
     """Ensures the config file exists, creating it if necessary."""
+    global _config_verified
+    
+    if _config_verified:
+        return False
+    
     if not os.path.exists(CONFIG_FILE):
         logger.warning("Config file missing during gameplay, regenerating...")
         create_default_config(CONFIG_FILE)
+        _config_verified = True
         return True  # Indicates config was recreated
+    _config_verified = True
     return False  # Config already exists
 
-def _initialize_stockfish():
-    """Initialize a persistent Stockfish process."""
-    global _stockfish_process
+def invalidate_config_cache():
+    """Forget that the config was checked so the next move looks at it again."""
+    global _config_verified
+    _config_verified = False
+
+def _resolve_stockfish_path():
+    """Locate the Stockfish binary once and remember it for later restarts."""
+    global _stockfish_path
+    
+    if _stockfish_path is not None:
+        return _stockfish_path
     
-    if _stockfish_process is not None:
-        return _stockfish_process
+    stockfish_path = resource_path("stockfish.exe" if os.name == "nt" else "stockfish")
+    
+    if os.name != "nt" and not os.path.exists(stockfish_path):
+        sys_stock = shutil.which("stockfish")
+        if sys_stock:
+            logger.debug("Falling back to system Stockfish at %s", sys_stock)
+            stockfish_path = sys_stock
+            
+    if not os.path.exists(stockfish_path) and shutil.which(stockfish_path) is None:
+        raise FileNotFoundError(f"Stockfish not found at {stockfish_path}")
     
+    _stockfish_path = stockfish_path
+    return _stockfish_path
+
+def reset_stockfish_path():
+    """Forget the resolved binary so the next start looks it up again."""
+    global _stockfish_path
+    _stockfish_path = None
+
+def _pump_stdout(stdout, lines):
+    """Forward engine output to the queue until the pipe closes, one batch of lines per read."""
+    fd = stdout.fileno()
+    buf = bytearray()
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except OSError:
+            break
+        if not chunk:
+            break
+        buf += chunk
+        # Split out every complete line; keep a trailing partial line for the next read
+        end = buf.rfind(b"\n")
+        if end < 0:
+            continue
+        lines.put(bytes(buf[:end]).split(b"\n"))
+        del buf[:end + 1]
+    if buf:
+        lines.put([bytes(buf)])
+    lines.put(None)  # EOF marker
+
+def _send(proc, commands):
+    """Write UCI commands to the engine in one syscall, bypassing Python's write buffer."""
+    data = memoryview(commands.encode())
+    fd = proc.stdin.fileno()
+    while data:
+        data = data[os.write(fd, data):]
+
+def _read_line(deadline):
+    """
+    Return the next engine line (without newline), None at EOF,
+    or raise TimeoutError once the deadline passes.
+    """
+    if _pending_lines:
+        return _pending_lines.popleft()
     try:
-        stockfish_path = resource_path("stockfish.exe" if os.name == "nt" else "stockfish")
-        
-        if os.name != "nt" and not os.path.exists(stockfish_path):
-            sys_stock = shutil.which("stockfish")
-            if sys_stock:
-                logger.debug(f"Falling back to system Stockfish at {sys_stock}")
-                stockfish_path = sys_stock
-                
-        if not os.path.exists(stockfish_path) and shutil.which(stockfish_path) is None:
-            raise FileNotFoundError(f"Stockfish not found at {stockfish_path}")
-        
-        flags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-        logger.debug(f"Using Stockfish path: {stockfish_path}")
-        
-        _stockfish_process = subprocess.Popen(
-            [stockfish_path],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            creationflags=flags
-        )
+        batch = _stockfish_lines.get(timeout=max(0.0, deadline - time.monotonic()))
+    except queue.Empty:
+        raise TimeoutError("Stockfish did not answer in time") from None
+    if batch is None:
+        return None
+    _pending_lines.extend(batch)
+    return _pending_lines.popleft()
 
-        # Load custom engine config
-        load_engine_config(_stockfish_process)
-        
-        logger.info("Stockfish process initialized")
-        return _stockfish_process
+def _engine_lines(timeout, stop_process=None):
+    """
+    Yield engine output lines until the pipe closes, for at most timeout seconds.
+    If stop_process is given, running out of time first sends it 'stop' and
+    allows a short grace period for the final bestmove; otherwise TimeoutError is raised.
+    """
+    deadline = time.monotonic() + timeout
+    stop_sent = False
+    while True:
+        try:
+            line = _read_line(deadline)
+        except TimeoutError:
+            if stop_process is None or stop_sent:
+                raise
+            # Ask for the best move found so far instead of waiting forever
+            logger.warning("Search deadline reached, sending stop to Stockfish")
+            _send(stop_process, "stop\n")
+            stop_sent = True
+            deadline = time.monotonic() + AppConfig.ENGINE_RESPONSE_TIMEOUT
+            continue
+        if line is None:
+            return
+        yield line
+
+def _wait_for_reply(reply, context):
+    """Consume engine output up to the given reply line (readyok, uciok)."""
+    for line in _engine_lines(AppConfig.ENGINE_RESPONSE_TIMEOUT):
+        if line.strip() == reply:
+            return
+    raise RuntimeError(f"Stockfish exited {context}")
+
+def _initialize_stockfish():
+    """Initialize a persistent Stockfish process."""
+    global _stockfish_process, _stockfish_lines
+    
+    with _stockfish_lock:
+        if _stockfish_process is not None:
+            return _stockfish_process
         
-    except Exception as e:
-        logger.error(f"Failed to initialize Stockfish: {e}")
-        _stockfish_process = None
-        raise
+        try:
+            stockfish_path = _resolve_stockfish_path()
+            
+            flags = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+            logger.debug("Using Stockfish path: %s", stockfish_path)
+            
+            _stockfish_process = subprocess.Popen(
+                [stockfish_path],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                # stderr is never read; a full, undrained pipe would stall the engine
+                stderr=subprocess.DEVNULL,
+                # Our fds are non-inheritable (PEP 446), so skipping the close
+                # sweep is safe and lets CPython spawn via posix_spawn on POSIX
+                close_fds=os.name == "nt",
+                creationflags=flags
+            )
+            _stockfish_lines = queue.Queue()
+            _pending_lines.clear()
+            _forget_ponder()
+            threading.Thread(
+                target=_pump_stdout,
+                args=(_stockfish_process.stdout, _stockfish_lines),
+                daemon=True
+            ).start()
+
+            # Switch the engine to UCI mode before sending any options
+            _send(_stockfish_process, "uci\n")
+            _wait_for_reply(b"uciok", "during the UCI handshake")
+
+            # Load custom engine config
+            load_engine_config(_stockfish_process)
+            
+            logger.info("Stockfish process initialized")
+            return _stockfish_process
+            
+        except Exception as e:
+            logger.error("Failed to initialize Stockfish: %s", e)
+            _stockfish_process = None
+            raise
 
 def cleanup_stockfish():
     """Clean up the persistent Stockfish process."""
-    global _stockfish_process
+    global _stockfish_process, _last_fen
     
-    if _stockfish_process is not None:
-        try:
-            _stockfish_process.stdin.write("quit\n")
-            _stockfish_process.stdin.flush()
-            _stockfish_process.wait(timeout=5)
-        except Exception as e:
-            logger.error(f"Error terminating Stockfish process: {e}")
-            _stockfish_process.terminate()
-        finally:
+    with _stockfish_lock:
+        # Re-resolve the binary on next start in case it was replaced
+        reset_stockfish_path()
+        _last_fen = None
+        _forget_ponder()
+        if _stockfish_process is not None:
+            try:
+                _send(_stockfish_process, "quit\n")
+                _stockfish_process.wait(timeout=5)
+            except Exception as e:
+                logger.error("Error terminating Stockfish process: %s", e)
+                _stockfish_process.terminate()
+            finally:
+                _stockfish_process = None
+                logger.info("Stockfish process cleaned up")
+
+def _kill_stockfish():
+    """Forcefully end the Stockfish process without the quit handshake."""
+    global _stockfish_process, _last_fen
+    
+    with _stockfish_lock:
+        if _stockfish_process is not None:
+            _stockfish_process.kill()
+            _stockfish_process.wait()
             _stockfish_process = None
-            logger.info("Stockfish process cleaned up")
+            _last_fen = None
+            _forget_ponder()
+            logger.info("Stockfish process killed")
+
+# Make sure the engine does not outlive the app if the window never gets a close event
+atexit.register(cleanup_stockfish)
 
 def initialize_stockfish_at_startup():
     """Initialize Stockfish at application startup."""
@@ -143,7 +340,7 @@ def initialize_stockfish_at_startup():
             logger.error("Failed to initialize Stockfish at startup")
             return False
     except Exception as e:
-        logger.error(f"Error initializing Stockfish at startup: {e}")
+        logger.error("Error initializing Stockfish at startup: %s", e)
         return False
 
 def get_best_move(depth_var, fen, root=None, auto_mode_var=None):
@@ -157,25 +354,42 @@ def get_best_move(depth_var, fen, root=None, auto_mode_var=None):
         if root and hasattr(root, 'update_status'):
             root.update_status("Processing... Stockfish is thinking...")
         
-        stockfish = _setup_stockfish_engine()
-        if stockfish is None:
-            return _handle_stockfish_failure("Failed to initialize Stockfish", root, auto_mode_var)
-        
-        best_move, mate_flag = _get_move_from_engine(stockfish, depth_var, fen, root)
-        if best_move is None:
-            return _handle_stockfish_failure(
-                "Stockfish did not respond. Please download the correct version according to your CPU architecture.",
-                root, auto_mode_var
-            )
-        
-        if root and hasattr(root, 'update_status'):
-            root.update_status(f"Best move found: {best_move}")
-        
-        updated_fen = _get_updated_fen(stockfish, fen, best_move)
+        with _stockfish_lock:
+            stockfish = _setup_stockfish_engine()
+            if stockfish is None:
+                return _handle_stockfish_failure("Failed to initialize Stockfish", root, auto_mode_var)
+            
+            best_move, ponder_move, mate_flag = _get_move_from_engine(stockfish, depth_var, fen, root)
+            if best_move is None:
+                return _handle_stockfish_failure(
+                    "Stockfish did not respond. Please download the correct version according to your CPU architecture.",
+                    root, auto_mode_var
+                )
+            
+            if root and hasattr(root, 'update_status'):
+                root.update_status(f"Best move found: {best_move}")
+            
+            try:
+                updated_fen = apply_uci_move(fen, best_move)
+            except ValueError as e:
+                logger.warning("Local FEN update failed (%s), asking engine instead", e)
+                updated_fen = _get_updated_fen(stockfish, fen, best_move)
+            
+            if AppConfig.ENGINE_PONDER and ponder_move and updated_fen:
+                _start_pondering(stockfish, fen, best_move, ponder_move, updated_fen, depth_var)
         return best_move, updated_fen, mate_flag
 
+    except TimeoutError as e:
+        # A hung engine won't answer quit, so don't wait on it
+        logger.error("Stockfish stopped responding: %s", e)
+        _kill_stockfish()
+        return _handle_stockfish_failure(
+            "Stockfish stopped responding and was stopped. It will be restarted on the next move.",
+            root, auto_mode_var
+        )
+
     except Exception as e:
-        logger.error(f"Stockfish error: {str(e)}")
+        logger.error("Stockfish error: %s", e)
         cleanup_stockfish()
         return _handle_error(e, root, auto_mode_var)
 
@@ -188,77 +402,180 @@ def _setup_stockfish_engine():
     stockfish = _initialize_stockfish()
     
     if config_recreated and stockfish:
+        # Options can't be changed while a ponder search is running
+        _stop_pondering(stockfish)
         logger.info("Reloading config into existing Stockfish process")
         load_engine_config(stockfish)
     
     return stockfish
 
 
+def _is_successor_position(previous_fen, fen):
+    """
+    Whether fen can come later in the same game as previous_fen.
+    Screen-derived FENs carry no move counters, so this relies on material:
+    pieces and pawns can only disappear during a game.
+    """
+    before = previous_fen.split()[0]
+    after = fen.split()[0]
+    pieces_before = sum(ch.isalpha() for ch in before)
+    pieces_after = sum(ch.isalpha() for ch in after)
+    return (
+        pieces_after <= pieces_before
+        and after.count("P") <= before.count("P")
+        and after.count("p") <= before.count("p")
+    )
+
+
+def _start_new_game_if_needed(stockfish, fen):
+    """
+    Send ucinewgame only when the position does not follow from the last one,
+    so the engine keeps its hash between moves of the same game.
+    """
+    global _last_fen
+    
+    new_game = _last_fen is None or not _is_successor_position(_last_fen, fen)
+    _last_fen = fen
+    if not new_game:
+        return
+    
+    logger.info("New game detected, sending ucinewgame")
+    _send(stockfish, "ucinewgame\nisready\n")
+    _wait_for_reply(b"readyok", "during ucinewgame")
+
+
+def reset_engine():
+    """
+    Make the next search start with ucinewgame, e.g. when the user starts a new game.
+    Only flips state (no engine I/O, no lock) so it is safe to call from the GUI thread.
+    """
+    global _last_fen
+    _last_fen = None
+    logger.info("Engine will start a new game on the next search")
+
+
 def _get_move_from_engine(stockfish, depth_var, fen, root=None):
     """
     Send position and depth to engine, parse response for best move and mate detection.
     """
-    stockfish.stdin.write(f"position fen {fen}\n")
-    stockfish.stdin.write(f"go depth {depth_var}\n")
-    stockfish.stdin.flush()
+    if not _take_ponder_hit(stockfish, fen):
+        _start_new_game_if_needed(stockfish, fen)
+        _send(stockfish, f"position fen {fen}\ngo depth {depth_var}\n")
     
     best_move = None
-    mate_flag = False
+    ponder_move = None
+    last_score = None
     last_depth = 0
+    last_update_ts = 0.0
+    search_timeout = AppConfig.ENGINE_BASE_TIMEOUT + AppConfig.ENGINE_TIMEOUT_PER_DEPTH * int(depth_var)
+    # Checked once per search instead of once per info line
+    log_engine_output = logger.isEnabledFor(logging.DEBUG)
     
-    while True:
-        line = stockfish.stdout.readline()
-        if not line:
-            break
-            
-        logger.debug(f"Engine output: {line.strip()}")
+    for line in _engine_lines(search_timeout, stop_process=stockfish):
+        # Lines we don't parse (info string, currmove, ...) are never decoded
+        match = _ENGINE_LINE_RE.match(line)
+        if match is None:
+            continue
         
-        if "info depth" in line and root and hasattr(root, 'update_status'):
-            try:
-                depth_part = line.split("info depth")[1].split()[0]
-                current_depth = int(depth_part)
-                if current_depth > last_depth:
-                    last_depth = current_depth
-                    root.update_status(f"Processing... Depth {current_depth}/{depth_var}")
-            except (IndexError, ValueError):
-                pass
+        if log_engine_output:
+            logger.debug("Engine output: %s", line.strip().decode())
+        bestmove, ponder, depth, score_kind, score_value = match.groups()
+        if bestmove is not None:
+            best_move = bestmove.decode("ascii")
+            if ponder is not None:
+                ponder_move = ponder.decode("ascii")
+            logger.info("Best move received: %s", best_move)
+            break
         
-        mate_flag = _check_for_mate(line, mate_flag)
-        best_move = _extract_best_move(line)
+        current_depth = int(depth)
+        if current_depth > last_depth and root and hasattr(root, 'update_status'):
+            # Cap status updates so fast searches don't flood the GUI thread
+            now = time.monotonic()
+            if now - last_update_ts >= AppConfig.ENGINE_STATUS_UPDATE_INTERVAL or current_depth == int(depth_var):
+                last_depth = current_depth
+                last_update_ts = now
+                root.update_status(f"Processing... Depth {current_depth}/{depth_var}")
         
-        if best_move:
-            logger.info(f"Best move received: {best_move}")
-            break
+        # Only the score of the final iteration matters; parse it after bestmove
+        if score_kind is not None:
+            last_score = (score_kind, score_value)
     
-    return best_move, mate_flag
+    mate_flag = last_score is not None and last_score[0] == b"mate" and abs(int(last_score[1])) == 1
+    if mate_flag:
+        logger.info("Mate in 1 detected")
+    
+    return best_move, ponder_move, mate_flag
 
 
-def _check_for_mate(line, current_mate_flag):
+def _ponder_key_of(fen):
     """
-    Check if the engine output indicates a mate in 1.
+    Piece placement and side to move: the part of a FEN read from the screen
+    that can be compared with a predicted position.
     """
-    if "score mate" not in line:
-        return current_mate_flag
+    return fen.split(" ", 2)[:2]
+
+
+def _start_pondering(stockfish, fen, best_move, ponder_move, updated_fen, depth_var):
+    """
+    Search the position after the engine's expected reply while the opponent thinks.
+    The search holds its bestmove until ponderhit or stop.
+    """
+    global _ponder_key
     
     try:
-        parts = line.split("score mate")
-        mate_val = int(parts[1].split()[0])
-        if abs(mate_val) == 1:
-            logger.info("Mate in 1 detected")
-            return True
-    except (IndexError, ValueError):
-        logger.warning("Could not parse mate score")
+        predicted_fen = apply_uci_move(updated_fen, ponder_move)
+    except ValueError as e:
+        logger.debug("Not pondering on %s: %s", ponder_move, e)
+        return
     
-    return current_mate_flag
+    _send(stockfish, f"position fen {fen} moves {best_move} {ponder_move}\ngo ponder depth {depth_var}\n")
+    _ponder_key = _ponder_key_of(predicted_fen)
+    logger.info("Pondering on expected reply %s", ponder_move)
 
 
-def _extract_best_move(line):
+def _take_ponder_hit(stockfish, fen):
     """
-    Extract best move from engine output line.
+    If the engine is pondering on fen, turn that search into the real one and return True.
+    Otherwise stop any ponder search and return False.
     """
-    if line.startswith("bestmove"):
-        return line.strip().split()[1]
-    return None
+    global _ponder_key, _last_fen
+    
+    if _ponder_key is None:
+        return False
+    if _ponder_key != _ponder_key_of(fen):
+        _stop_pondering(stockfish)
+        return False
+    
+    logger.info("Opponent played the expected move, continuing ponder search")
+    _send(stockfish, "ponderhit\n")
+    _ponder_key = None
+    _last_fen = fen
+    return True
+
+
+def _stop_pondering(stockfish):
+    """
+    End a running ponder search and discard its result.
+    """
+    global _ponder_key
+    
+    if _ponder_key is None:
+        return
+    _ponder_key = None
+    _send(stockfish, "stop\n")
+    for line in _engine_lines(AppConfig.ENGINE_RESPONSE_TIMEOUT):
+        if line.startswith(b"bestmove"):
+            logger.debug("Ponder search stopped")
+            return
+    raise RuntimeError("Stockfish exited while stopping the ponder search")
+
+
+def _forget_ponder():
+    """
+    Drop ponder state when the process it belonged to goes away.
+    """
+    global _ponder_key
+    _ponder_key = None
 
 
 def _get_updated_fen(stockfish, original_fen, best_move):
@@ -268,20 +585,13 @@ def _get_updated_fen(stockfish, original_fen, best_move):
     if not best_move:
         return None
     
-    stockfish.stdin.write(f"position fen {original_fen} moves {best_move}\n")
-    stockfish.stdin.write("d\n")
-    stockfish.stdin.flush()
+    _send(stockfish, f"position fen {original_fen} moves {best_move}\nd\n")
     
-    while True:
-        line = stockfish.stdout.readline()
-        if not line:
-            break
-            
-        logger.debug(f"Engine output for new FEN: {line.strip()}")
-        
-        if "Fen:" in line:
-            updated_fen = line.split("Fen:")[1].strip()
-            logger.info(f"Updated FEN: {updated_fen}")
+    for line in _engine_lines(AppConfig.ENGINE_RESPONSE_TIMEOUT):
+        idx = line.find(b"Fen:")
+        if idx >= 0:
+            updated_fen = line[idx + 4:].strip().decode("ascii")
+            logger.info("Updated FEN: %s", updated_fen)
             return updated_fen
     
     return None
@@ -293,7 +603,7 @@ def _handle_stockfish_failure(error_msg, root, auto_mode_var):
     """
     logger.error(error_msg)
     _show_error_dialog(root, error_msg)
-    _disable_auto_mode(auto_mode_var)
+    _disable_auto_mode(auto_mode_var, root)
     return None, None, False
 
 
@@ -303,7 +613,7 @@ def _handle_error(error, root, auto_mode_var):
     """
     error_msg = f"Stockfish error: {str(error)}"
     _show_error_dialog(root, error_msg)
-    _disable_auto_mode(auto_mode_var)
+    _disable_auto_mode(auto_mode_var, root)
     return None, None, False
 
 
@@ -312,14 +622,16 @@ def _show_error_dialog(root, message):
     Show error dialog if root window is available.
     """
     if root:
-        QTimer.singleShot(0, lambda: QMessageBox.critical(root, "Error", message))
+        _gui.error_dialog.emit(root, message)
 
 
 def _disable_auto_mode(auto_mode_var, root):
     """
     Disable auto mode if the variable is available.
+    Safe to call from a worker thread: the checkbox is only touched on
+    the GUI thread, through a queued signal.
     """
-    if auto_mode_var:
+    if auto_mode_var and root:
         if callable(auto_mode_var):
             root.auto_mode_var = False
-            root.auto_mode_check.setChecked(False)
\ No newline at end of file
+            _gui.auto_mode_unchecked.emit(root)
@@ -0,0 +1,45 @@
+import logging
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+
+logger = logging.getLogger(__name__)
+
+
+class _GuiBridge(QObject):
+    """Queues status, button and checkbox updates from the move thread to the GUI thread."""
+    status_update = pyqtSignal(object, str)
+    button_enabled = pyqtSignal(object, bool)
+    checked = pyqtSignal(object, bool)
+
+    def __init__(self):
+        super().__init__()
+        # Queued even when emitted on the GUI thread, like the singleShot(0) calls they replace
+        self.status_update.connect(self._apply_status, Qt.ConnectionType.QueuedConnection)
+        self.button_enabled.connect(self._apply_button_enabled, Qt.ConnectionType.QueuedConnection)
+        self.checked.connect(self._apply_checked, Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot(object, str)
+    def _apply_status(self, update_status, message):
+        update_status(message)
+
+    @pyqtSlot(object, bool)
+    def _apply_button_enabled(self, button, enabled):
+        button.setEnabled(enabled)
+
+    @pyqtSlot(object, bool)
+    def _apply_checked(self, checkbox, checked):
+        checkbox.setChecked(checked)
+
+
+# Created at import, so it lives on the GUI thread and the slots run there
+gui_bridge = _GuiBridge()
+
+
+def stop_auto_mode(root, enable_play=False):
+    """
+    Turn auto mode off for the worker threads right away; the checkbox and,
+    if asked, the play button are updated on the GUI thread.
+    """
+    root.auto_mode_var = False
+    gui_bridge.checked.emit(root.auto_mode_check, False)
+    if enable_play:
+        gui_bridge.button_enabled.emit(root.btn_play, True)
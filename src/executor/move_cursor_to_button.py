@@ -1,65 +1,71 @@
 import os
 import logging
+import threading
 from typing import Optional, Tuple
-from PyQt6.QtCore import QTimer, QRect, QPoint
+from PyQt6.QtCore import QObject, Qt, QTimer, QThread, QThreadPool, QCoreApplication, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QMessageBox, QPushButton
 import pyautogui
+from wayland_capture import WaylandInput
+from .is_wayland import is_wayland
+
+# pyautogui sleeps PAUSE (0.1s) after every call and clamps short moves; our
+# callers time their own input, so turn both off. This also disables the
+# corner fail-safe: moving the mouse to a screen corner no longer aborts input.
+pyautogui.PAUSE = 0
+pyautogui.FAILSAFE = False
+pyautogui.MINIMUM_DURATION = 0
+pyautogui.MINIMUM_SLEEP = 0
+
+# The session type can't change while we run, so decide the backend once
+_IS_WINDOWS = os.name == 'nt'
+_IS_WAYLAND = not _IS_WINDOWS and is_wayland()
+
+if _IS_WINDOWS:
+    import win32api
 
 logger = logging.getLogger(__name__)
 
+# Shared Wayland client; connecting does a socket handshake and registry roundtrip
+_wayland_client = None
+_wayland_lock = threading.Lock()
+
+
+def _get_wayland_client() -> WaylandInput:
+    """Return the shared WaylandInput, connecting on first use."""
+    global _wayland_client
+    with _wayland_lock:
+        if _wayland_client is None:
+            _wayland_client = WaylandInput()
+        return _wayland_client
+
 
 class CursorMoveError(Exception):
     """Exception raised when cursor movement fails."""
     pass
 
 
-def get_button_info(btn_play: QPushButton) -> dict:
-    """Extract button information for logging."""
-    info = {"exists": btn_play is not None}
+def snapshot_button(btn_play: Optional[QPushButton]) -> Optional[Tuple[int, int]]:
+    """Global screen coordinates of the button center, or None if it is missing or hidden.
     
-    if not info["exists"]:
-        return info
-    
-    try:
-        info["text"] = btn_play.text()
-    except Exception:
-        info["text"] = "unknown"
-        logger.debug("Could not read button text", exc_info=True)
-    
-    try:
-        info["visible"] = btn_play.isVisible()
-    except Exception:
-        info["visible"] = False
-        logger.warning("Could not determine visibility", exc_info=True)
-    
-    return info
-
-
-def calculate_button_center(btn_play: QPushButton) -> Tuple[int, int]:
-    """Calculate global screen coordinates for button center.
+    Reads visibility, geometry and position in one pass.
     
     Raises:
         CursorMoveError: If coordinates cannot be calculated.
     """
-    try:
-        button_rect: QRect = btn_play.rect()
-        logger.debug(
-            "Button rect: x=%s, y=%s, w=%s, h=%s",
-            button_rect.x(), button_rect.y(), 
-            button_rect.width(), button_rect.height()
-        )
-    except Exception as e:
-        raise CursorMoveError(f"Failed to get button rectangle: {e}")
+    if btn_play is None:
+        logger.error("btn_play is None")
+        return None
     
     try:
-        global_top_left: QPoint = btn_play.mapToGlobal(button_rect.topLeft())
-        logger.debug("Global top-left: x=%d, y=%d", 
-                    global_top_left.x(), global_top_left.y())
+        if not btn_play.isVisible():
+            logger.warning("btn_play is not visible, skipping cursor move")
+            return None
+        rect = btn_play.rect()
+        top_left = btn_play.mapToGlobal(rect.topLeft())
+        center_x = top_left.x() + rect.width() // 2
+        center_y = top_left.y() + rect.height() // 2
     except Exception as e:
-        raise CursorMoveError(f"Failed to map to global coordinates: {e}")
-    
-    center_x = global_top_left.x() + (button_rect.width() // 2)
-    center_y = global_top_left.y() + (button_rect.height() // 2)
+        raise CursorMoveError(f"Failed to read button geometry: {e}")
     
     logger.debug("Calculated center: (%d, %d)", center_x, center_y)
     
@@ -75,31 +81,45 @@ def move_cursor_platform_specific(x: int, y: int) -> None:
     Raises:
         CursorMoveError: If cursor movement fails.
     """
-    if os.name == 'nt':
+    if _IS_WINDOWS:
         try:
-            import win32api
             win32api.SetCursorPos((int(x), int(y)))
             logger.debug("Cursor moved using win32api")
         except Exception as e:
             raise CursorMoveError(f"win32api failed: {e}")
     
-    elif is_wayland():
+    elif _IS_WAYLAND:
         try:
-            from wayland_capture import WaylandInput
-            client = WaylandInput()
-            client.click(int(x), int(y))
+            client = _get_wayland_client()
+            with _wayland_lock:
+                client.click(int(x), int(y))
             logger.debug("Cursor moved using Wayland")
         except Exception as e:
+            # Drop the connection so the next move reconnects
+            _reset_wayland_client()
             raise CursorMoveError(f"WaylandInput failed: {e}")
     
     else:
         try:
-            pyautogui.moveTo(x, y, duration=0.1)
+            # Jump straight there: no tweening and no implicit PAUSE afterwards
+            pyautogui.moveTo(x, y, duration=0, _pause=False)
             logger.debug("Cursor moved using pyautogui")
         except Exception as e:
             raise CursorMoveError(f"pyautogui failed: {e}")
 
 
+def _reset_wayland_client() -> None:
+    """Close and forget the shared Wayland client."""
+    global _wayland_client
+    with _wayland_lock:
+        if _wayland_client is not None:
+            try:
+                _wayland_client.sock.close()
+            except Exception:
+                logger.debug("Could not close Wayland socket", exc_info=True)
+            _wayland_client = None
+
+
 def disable_auto_mode(root) -> None:
     """Disable auto mode after error."""
     try:
@@ -128,6 +148,24 @@ def show_error_message(root, error_msg: str) -> None:
         logger.exception("Failed to show error message")
 
 
+class _ErrorBridge(QObject):
+    """Queues cursor move failures from worker and pool threads to the GUI thread."""
+    move_failed = pyqtSignal(object, str)
+
+    def __init__(self):
+        super().__init__()
+        self.move_failed.connect(self._report_failure, Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot(object, str)
+    def _report_failure(self, root, error_msg):
+        show_error_message(root, error_msg)
+        disable_auto_mode(root)
+
+
+# Created at import, so it lives on the GUI thread and the slot runs there
+_errors = _ErrorBridge()
+
+
 def move_cursor_to_button(root, auto_mode_var, btn_play: Optional[QPushButton]) -> None:
     """Move cursor to the Play Next Move button.
     
@@ -139,43 +177,46 @@ def move_cursor_to_button(root, auto_mode_var, btn_play: Optional[QPushButton])
     logger.debug("Attempting to move cursor to Play Next Move button")
     
     try:
-        # Validate button
-        btn_info = get_button_info(btn_play)
+        # Log current position (only queried when someone will see it)
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                current_pos = pyautogui.position()
+                logger.debug("Current mouse position: %s", current_pos)
+            except Exception:
+                logger.warning("Could not get current mouse position", exc_info=True)
         
-        if not btn_info["exists"]:
-            logger.error("btn_play is None")
+        # Widget geometry must be read here; the move itself only needs the ints
+        center = snapshot_button(btn_play)
+        if center is None:
             return
+        center_x, center_y = center
         
-        logger.debug("Button info: %s", btn_info)
-        
-        if not btn_info["visible"]:
-            logger.warning("btn_play is not visible, skipping cursor move")
-            return
-        
-        # Log current position
-        try:
-            current_pos = pyautogui.position()
-            logger.debug("Current mouse position: %s", current_pos)
-        except Exception:
-            logger.warning("Could not get current mouse position", exc_info=True)
-        
-        # Calculate target position and move cursor
-        center_x, center_y = calculate_button_center(btn_play)
-        move_cursor_platform_specific(center_x, center_y)
-        
-        logger.debug("Successfully moved cursor to (%d, %d)", center_x, center_y)
+        if _on_gui_thread():
+            # Keep the event loop painting while the platform call runs
+            QThreadPool.globalInstance().start(lambda: _move_cursor(root, center_x, center_y))
+        else:
+            _move_cursor(root, center_x, center_y)
         
     except CursorMoveError as e:
         logger.error("Cursor movement failed: %s", e)
-        show_error_message(root, str(e))
-        disable_auto_mode(root)
+        _errors.move_failed.emit(root, str(e))
         
     except Exception as e:
         logger.exception("Unexpected error in move_cursor_to_button: %s", e)
-        show_error_message(root, str(e))
-        disable_auto_mode(root)
+        _errors.move_failed.emit(root, str(e))
+
+
+def _move_cursor(root, x: int, y: int) -> None:
+    """Move the cursor and report failures; safe to run on a worker thread."""
+    try:
+        move_cursor_platform_specific(x, y)
+        logger.debug("Successfully moved cursor to (%d, %d)", x, y)
+    except CursorMoveError as e:
+        logger.error("Cursor movement failed: %s", e)
+        _errors.move_failed.emit(root, str(e))
 
 
-def is_wayland() -> bool:
-    """Check if running on Wayland (placeholder - implement based on your system)."""
-    return False
\ No newline at end of file
+def _on_gui_thread() -> bool:
+    """Whether we are running on the Qt main thread."""
+    app = QCoreApplication.instance()
+    return app is not None and QThread.currentThread() == app.thread()
@@ -47,7 +47,9 @@ def drag_piece(start_pos, end_pos, humanize=True, offset_range=(-16, 16), root=N
             client.swipe(int(round(start_x)), int(round(start_y)),
                          int(round(end_x)), int(round(end_y)), 0.001)
         else:
+            # pyautogui.PAUSE is 0, so hold the button explicitly like the Windows path
             pyautogui.mouseDown(start_x, start_y)
+            time.sleep(0.05)
             pyautogui.moveTo(end_x, end_y, duration=0.05)
             pyautogui.mouseUp(end_x, end_y)
         logger.info("Drag move simulated successfully")
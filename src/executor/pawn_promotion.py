@@ -3,18 +3,24 @@ import time
 import os
 import pyautogui
 import random
-from board_detection import get_positions, get_fen_from_position
+import threading
+import numpy as np
+from board_detection import get_positions_batch, get_fen_from_position, board_region_hash
+from board_detection.get_positions import batch_supported
 from executor.capture_screenshot_in_memory import capture_screenshot_in_memory
 from .is_wayland import is_wayland
+from .send_input_click import send_input_click
+from .capture_square_pixels import capture_square_pixels
+from core.config import AppConfig
 from wayland_capture.wayland import WaylandInput
 
-if os.name == 'nt':
-    import win32api
-    import win32con
-
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Wayland client reused across promotion clicks, connected on first use
+_wayland_client = None
+_wayland_lock = threading.Lock()
+
 # Piece class IDs from ONNX model
 PIECE_CLASS_IDS = {
     0: 'p',   # black pawn
@@ -36,10 +42,47 @@ PIECE_CLASS_IDS = {
 PROMOTION_PIECE_IDS = [10, 7, 9, 8]  # Q, R, B, N (uppercase - white pieces)
 PROMOTION_PIECE_IDS_BLACK = [4, 1, 3, 2]  # q, r, b, n (lowercase - black pieces)
 
-def detect_promotion_pieces(boxes, chessboard_box, color_indicator):
+# Promotion letters accepted at the end of a UCI move
+_PROMO_CHARS = frozenset('qrbnQRBN')
+
+# Promotion letter (from the UCI move) to class ID, per color
+_CHAR_TO_CLASS_W = {'q': 10, 'r': 7, 'b': 9, 'n': 8}
+_CHAR_TO_CLASS_B = {'q': 4, 'r': 1, 'b': 3, 'n': 2}
+
+# Array forms for the vectorized class filter
+_WHITE_PROMO_IDS = np.array(PROMOTION_PIECE_IDS, dtype=np.int32)
+_BLACK_PROMO_IDS = np.array(PROMOTION_PIECE_IDS_BLACK, dtype=np.int32)
+
+# Pre-drawn (dx, dy) humanize offsets for the default promotion click range
+_DEFAULT_OFFSET_RANGE = (-8, 8)
+_OFFSET_BUFFER_SIZE = 512
+_RNG = np.random.default_rng()
+_offset_buffer = _RNG.uniform(*_DEFAULT_OFFSET_RANGE, size=(_OFFSET_BUFFER_SIZE, 2)).tolist()
+_offset_index = 0
+
+class PromotionCandidate:
+    """A promotion piece detected on screen."""
+    __slots__ = (
+        "box", "class_id", "confidence", "position",
+        "file", "rank", "is_promotion_rank", "piece_char",
+    )
+    
+    def __init__(self, box, class_id, confidence, position, file, rank, is_promotion_rank, piece_char):
+        self.box = box
+        self.class_id = class_id
+        self.confidence = confidence
+        self.position = position
+        self.file = file
+        self.rank = rank
+        self.is_promotion_rank = is_promotion_rank
+        self.piece_char = piece_char
+
+
+def detect_promotion_pieces(boxes, chessboard_box, color_indicator, max_results=None):
     """
     Detect promotion pieces on the board.
-    Returns list of detected promotion pieces with their positions and class info.
+    Returns list of detected promotion pieces with their positions and class info,
+    ordered top to bottom, then left to right, and cut to the first max_results if given.
     """
     try:
         chessboard_x = chessboard_box[0]
@@ -50,48 +93,62 @@ def detect_promotion_pieces(boxes, chessboard_box, color_indicator):
         # Filter boxes to find promotion pieces
         # Promotion pieces are typically displayed on or near the promotion rank
         promotion_boxes = []
+        if not boxes:
+            return promotion_boxes
         
         # Determine which piece IDs to look for based on color
-        if color_indicator == 'w':
-            target_promotion_ids = PROMOTION_PIECE_IDS
-        else:
-            target_promotion_ids = PROMOTION_PIECE_IDS_BLACK
+        target_promotion_ids = _WHITE_PROMO_IDS if color_indicator == 'w' else _BLACK_PROMO_IDS
         
-        for box in boxes:
-            x, y, w, h, confidence, class_id = box
-            
-            # Look for promotion pieces with reasonable confidence
-            if int(class_id) in target_promotion_ids and confidence > 0.4:
-                # Check if piece is on the board or near promotion rank
-                center_x = x + w / 2
-                center_y = y + h / 2
-                
-                # Calculate relative position to chessboard
-                rel_x = center_x - chessboard_x
-                rel_y = center_y - chessboard_y
-                
-                # Check if within board bounds
-                if -square_size < rel_x < (chessboard_width + square_size) and \
-                   -square_size < rel_y < (chessboard_width + square_size):
-                    
-                    file_index = int(rel_x // square_size)
-                    row_index = int(rel_y // square_size)
-                    
-                    # Check if it's in valid promotion area
-                    # White promotes on rank 8 (row_index 0), Black on rank 1 (row_index 7)
-                    is_promotion_rank = (color_indicator == 'w' and row_index == 0) or \
-                                       (color_indicator == 'b' and row_index == 7)
-                    
-                    promotion_boxes.append({
-                        'box': box,
-                        'class_id': int(class_id),
-                        'confidence': confidence,
-                        'position': (center_x, center_y),
-                        'file': file_index if 0 <= file_index < 8 else None,
-                        'rank': row_index if 0 <= row_index < 8 else None,
-                        'is_promotion_rank': is_promotion_rank,
-                        'piece_char': PIECE_CLASS_IDS.get(int(class_id), '?')
-                    })
+        # Filter every box at once; only survivors are turned into candidates
+        arr = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+        class_ids = arr[:, 5].astype(np.int32)
+        
+        # Cheap checks first: during normal play no box is a promotion piece
+        prelim = np.flatnonzero(np.isin(class_ids, target_promotion_ids) & (arr[:, 4] > 0.4))
+        if prelim.size == 0:
+            logger.debug(f"Detected 0 potential promotion pieces for {color_indicator}")
+            return promotion_boxes
+        
+        subset = arr[prelim]
+        center_x = subset[:, 0] + subset[:, 2] * 0.5
+        center_y = subset[:, 1] + subset[:, 3] * 0.5
+        
+        # Calculate relative position to chessboard
+        rel_x = center_x - chessboard_x
+        rel_y = center_y - chessboard_y
+        
+        # Keep pieces within board bounds (one square of slack on each side)
+        lower = -square_size
+        upper = chessboard_width + square_size
+        mask = (rel_x > lower) & (rel_x < upper) & (rel_y > lower) & (rel_y < upper)
+        
+        # White promotes on rank 8 (row_index 0), Black on rank 1 (row_index 7)
+        promotion_row = 0 if color_indicator == 'w' else 7
+        
+        # Order survivors by position (top to bottom, left to right) while still in arrays
+        survivors = np.flatnonzero(mask)
+        survivors = survivors[np.lexsort((center_x[survivors], center_y[survivors]))]
+        if max_results is not None:
+            survivors = survivors[:max_results]
+        
+        # Square indices only for survivors, converted to Python scalars in one go
+        file_indices = np.floor_divide(rel_x[survivors], square_size).astype(np.int32).tolist()
+        row_indices = np.floor_divide(rel_y[survivors], square_size).astype(np.int32).tolist()
+        centers = zip(center_x[survivors].tolist(), center_y[survivors].tolist())
+        
+        for i, file_index, row_index, position in zip(prelim[survivors].tolist(), file_indices, row_indices, centers):
+            box = boxes[i]
+            class_id = int(class_ids[i])
+            promotion_boxes.append(PromotionCandidate(
+                box=box,
+                class_id=class_id,
+                confidence=box[4],
+                position=position,
+                file=file_index if 0 <= file_index < 8 else None,
+                rank=row_index if 0 <= row_index < 8 else None,
+                is_promotion_rank=color_indicator in ('w', 'b') and row_index == promotion_row,
+                piece_char=PIECE_CLASS_IDS.get(class_id, '?'),
+            ))
         
         logger.debug(f"Detected {len(promotion_boxes)} potential promotion pieces for {color_indicator}")
         return promotion_boxes
@@ -101,20 +158,20 @@ def detect_promotion_pieces(boxes, chessboard_box, color_indicator):
         return []
 
 
-def find_promotion_dialog_pieces(boxes, chessboard_box, color_indicator):
+def find_promotion_dialog_pieces(boxes, chessboard_box, color_indicator, promotion_pieces=None):
     """
     Find promotion pieces in a promotion dialog (typically 4 pieces shown).
     Returns the 4 pieces (Queen, Rook, Bishop, Knight) in order by their position.
+    Pass promotion_pieces to reuse a detection that was already run on these boxes.
     """
-    promotion_pieces = detect_promotion_pieces(boxes, chessboard_box, color_indicator)
+    if promotion_pieces is None:
+        promotion_pieces = detect_promotion_pieces(boxes, chessboard_box, color_indicator, max_results=4)
     
     if len(promotion_pieces) < 4:
         logger.warning(f"Expected 4 promotion pieces, found {len(promotion_pieces)}")
     
-    # Sort by position (left to right, top to bottom)
-    promotion_pieces.sort(key=lambda p: (p['position'][1], p['position'][0]))
-    
-    logger.debug(f"Sorted promotion pieces: {[p['piece_char'] for p in promotion_pieces]}")
+    # detect_promotion_pieces already returns them ordered by position
+    logger.debug(f"Sorted promotion pieces: {[p.piece_char for p in promotion_pieces]}")
     return promotion_pieces[:4]  # Return up to 4 pieces
 
 
@@ -126,23 +183,27 @@ def select_promotion_piece(piece_position, move_mode="drag", humanize=True, offs
         x, y = piece_position
         
         # Apply humanize offsets
-        if humanize and offset_range:
-            min_off, max_off = offset_range
-            if min_off > max_off:
-                min_off, max_off = max_off, min_off
-            x += random.uniform(min_off, max_off)
-            y += random.uniform(min_off, max_off)
+        if humanize and tuple(offset_range or ()) == _DEFAULT_OFFSET_RANGE:
+            dx, dy = _next_default_offset()
+            x += dx
+            y += dy
+        elif humanize and offset_range:
+            lo, hi = min(offset_range), max(offset_range)
+            x += random.uniform(lo, hi)
+            y += random.uniform(lo, hi)
         
         logger.debug(f"Clicking promotion piece at ({x}, {y})")
         
         if os.name == 'nt':
-            win32api.SetCursorPos((int(round(x)), int(round(y))))
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-            time.sleep(0.05)
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+            send_input_click(x, y)
         elif is_wayland():
-            client = WaylandInput()
-            client.click(int(round(x)), int(round(y)), button="left")
+            try:
+                with _wayland_lock:
+                    _get_wayland_client().click(int(round(x)), int(round(y)), button="left")
+            except Exception:
+                # Drop the connection so the next promotion reconnects
+                _reset_wayland_client()
+                raise
         else:
             pyautogui.click(x, y)
         
@@ -155,33 +216,70 @@ def select_promotion_piece(piece_position, move_mode="drag", humanize=True, offs
         return False
 
 
+def _get_wayland_client():
+    """
+    Return the shared WaylandInput; caller holds _wayland_lock.
+    """
+    global _wayland_client
+    if _wayland_client is None:
+        _wayland_client = WaylandInput()
+    return _wayland_client
+
+
+def _reset_wayland_client():
+    """
+    Close and forget the shared Wayland client.
+    """
+    global _wayland_client
+    with _wayland_lock:
+        if _wayland_client is not None:
+            try:
+                _wayland_client.sock.close()
+            except Exception:
+                logger.debug("Could not close Wayland socket", exc_info=True)
+            _wayland_client = None
+
+
+def _next_default_offset():
+    """
+    Pop the next pre-drawn offset pair, refilling the buffer when it wraps.
+    """
+    global _offset_buffer, _offset_index
+    if _offset_index >= _OFFSET_BUFFER_SIZE:
+        _offset_buffer = _RNG.uniform(*_DEFAULT_OFFSET_RANGE, size=(_OFFSET_BUFFER_SIZE, 2)).tolist()
+        _offset_index = 0
+    offset = _offset_buffer[_offset_index]
+    _offset_index += 1
+    return offset
+
+
 def is_pawn_promotion_move(move_notation):
     """
     Check if a move is a pawn promotion move.
     Promotion moves have format like 'e7e8q' or 'a2a1r'
     """
     # Pawn promotion moves in UCI format have 5 characters: source (2) + dest (2) + promotion piece (1)
-    if len(move_notation) == 5 and move_notation[4] in ['q', 'r', 'b', 'n', 'Q', 'R', 'B', 'N']:
-        return True
-    return False
+    return len(move_notation) == 5 and move_notation[4] in _PROMO_CHARS
 
 
-def get_promotion_piece_from_move(move_notation):
+def parse_promotion(move_notation):
     """
-    Extract the promotion piece from move notation.
+    Return the lowercase promotion piece (q, r, b, n) of a UCI move, or None if it isn't a promotion.
     """
-    if len(move_notation) == 5:
-        return move_notation[4].lower()  # q, r, b, n
-    return None
+    return move_notation[4].lower() if len(move_notation) == 5 and move_notation[4] in _PROMO_CHARS else None
 
 
 def is_promotion_dialog_visible(boxes, chessboard_box, color_indicator, min_pieces=4):
     """
     Check if promotion dialog is visible by detecting if at least min_pieces promotion pieces are present.
     New function to confirm promotion dialog appeared before selecting piece.
+    Returns the detected pieces when visible (so callers can reuse them), an empty list otherwise.
     """
-    promotion_pieces = detect_promotion_pieces(boxes, chessboard_box, color_indicator)
-    return len(promotion_pieces) >= min_pieces
+    # The dialog only uses the first four by position, so don't build the rest
+    promotion_pieces = detect_promotion_pieces(
+        boxes, chessboard_box, color_indicator, max_results=max(min_pieces, 4)
+    )
+    return promotion_pieces if len(promotion_pieces) >= min_pieces else []
 
 
 def wait_for_promotion_dialog(color_indicator, max_wait_time=1.5, check_interval=0.15):
@@ -192,57 +290,112 @@ def wait_for_promotion_dialog(color_indicator, max_wait_time=1.5, check_interval
     Args:
         color_indicator: 'w' for white, 'b' for black
         max_wait_time: Maximum time to wait in seconds
-        check_interval: Time between checks in seconds
+        check_interval: Longest pause between checks in seconds
     
     Returns:
-        Tuple of (boxes, chessboard_box) if dialog found, None otherwise
+        Tuple of (boxes, chessboard_box, promotion_pieces) if dialog found, None otherwise
     """
-    elapsed = 0
+    start = time.monotonic()
+    deadline = start + max_wait_time
+    # Check again quickly at first, backing off towards check_interval
+    interval = min(AppConfig.PROMOTION_POLL_INITIAL_INTERVAL, check_interval)
+    # Several frames per check only pay off when the model runs them as one batch
+    frames_per_check = AppConfig.PROMOTION_FRAMES_PER_BATCH if batch_supported else 1
+    # Board area seen by the last inference that found no dialog; identical pixels need no new inference
+    board_box = None
+    board_digest = None
     
-    while elapsed < max_wait_time:
+    while time.monotonic() < deadline:
         try:
-            img = capture_screenshot_in_memory()
-            if not img:
-                logger.debug(f"Screenshot failed, waiting... ({elapsed:.2f}s)")
-                time.sleep(check_interval)
-                elapsed += check_interval
-                continue
-            
-            boxes = get_positions(img)
-            if not boxes:
-                logger.debug(f"Board detection failed, waiting... ({elapsed:.2f}s)")
-                time.sleep(check_interval)
-                elapsed += check_interval
-                continue
-            
-            # Find chessboard
-            chessboard_boxes = [box for box in boxes if box[5] == 12.0]
-            if not chessboard_boxes:
-                logger.debug(f"Chessboard not detected, waiting... ({elapsed:.2f}s)")
-                time.sleep(check_interval)
-                elapsed += check_interval
-                continue
-            
-            chessboard_box = chessboard_boxes[0]
-            
-            # Check if promotion dialog is visible
-            if is_promotion_dialog_visible(boxes, chessboard_box, color_indicator, min_pieces=4):
-                logger.info(f"Promotion dialog detected after {elapsed:.2f}s")
-                return boxes, chessboard_box
-            
-            logger.debug(f"Promotion dialog not yet visible, waiting... ({elapsed:.2f}s)")
-            time.sleep(check_interval)
-            elapsed += check_interval
-        
+            digest = _board_digest(board_box) if board_box is not None else None
+            if digest is not None and digest == board_digest:
+                logger.debug(f"Board unchanged, skipping detection... ({time.monotonic() - start:.2f}s)")
+            else:
+                # Hashed before capturing, so a change during the capture is caught next time
+                board_digest = digest
+                frames = _capture_frames(frames_per_check, interval, deadline)
+                elapsed = time.monotonic() - start
+                if not frames:
+                    logger.debug(f"Screenshot failed, waiting... ({elapsed:.2f}s)")
+                else:
+                    # Frames are in capture order, so the first hit is the earliest one
+                    for boxes in get_positions_batch(frames):
+                        dialog_result = _find_promotion_dialog(boxes, color_indicator, elapsed)
+                        if dialog_result:
+                            logger.info(f"Promotion dialog detected after {time.monotonic() - start:.2f}s")
+                            return dialog_result
+                        if boxes and board_box is None:
+                            board_box = next((box for box in boxes if box[5] == 12.0), None)
         except Exception as e:
             logger.debug(f"Error checking for promotion dialog: {e}")
-            time.sleep(check_interval)
-            elapsed += check_interval
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 1.5, check_interval)
     
     logger.warning(f"Promotion dialog did not appear within {max_wait_time}s")
     return None
 
 
+def _board_digest(board_box):
+    """
+    Hash the on-screen pixels of the board area.
+    Returns None where a region grab is unavailable (Wayland) or fails.
+    """
+    x, y, w, h = board_box[:4]
+    half_size = int(max(w, h) / 2)
+    pixels = capture_square_pixels((x + w / 2, y + h / 2), half_size)
+    if pixels is None:
+        return None
+    side = 2 * half_size
+    square = np.frombuffer(pixels, dtype=np.uint8).reshape(side, side, 3)
+    return board_region_hash(square, (0, 0, side, side))
+
+
+def _capture_frames(count, interval, deadline):
+    """
+    Take up to count screenshots interval seconds apart, stopping at the deadline.
+    Failed captures are skipped.
+    """
+    frames = []
+    for i in range(count):
+        if i:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+        img = capture_screenshot_in_memory()
+        if img:
+            frames.append(img)
+    return frames
+
+
+def _find_promotion_dialog(boxes, color_indicator, elapsed):
+    """
+    Look for the promotion dialog in one frame's detections.
+    Returns (boxes, chessboard_box, promotion_pieces) if visible, None otherwise.
+    """
+    if not boxes:
+        logger.debug(f"Board detection failed, waiting... ({elapsed:.2f}s)")
+        return None
+    
+    # Find chessboard (stop at the first one)
+    chessboard_box = next((box for box in boxes if box[5] == 12.0), None)
+    if chessboard_box is None:
+        logger.debug(f"Chessboard not detected, waiting... ({elapsed:.2f}s)")
+        return None
+    
+    # Check if promotion dialog is visible
+    promotion_pieces = is_promotion_dialog_visible(boxes, chessboard_box, color_indicator, min_pieces=4)
+    if not promotion_pieces:
+        logger.debug(f"Promotion dialog not yet visible, waiting... ({elapsed:.2f}s)")
+        return None
+    
+    return boxes, chessboard_box, promotion_pieces
+
+
 def handle_pawn_promotion(
     color_indicator, move, board_positions, chessboard_data,
     auto_mode_var, root, move_mode, humanize=True, max_retries=2
@@ -266,12 +419,13 @@ def handle_pawn_promotion(
         True if promotion was successful, False otherwise
     """
     
-    if not is_pawn_promotion_move(move):
+    promotion_piece = parse_promotion(move)
+    if promotion_piece is None:
         logger.debug(f"Move {move} is not a promotion move")
         return False
     
-    promotion_piece = get_promotion_piece_from_move(move)
     logger.info(f"Handling pawn promotion to {promotion_piece.upper()} for move {move}")
+    target_class_id = (_CHAR_TO_CLASS_W if color_indicator == 'w' else _CHAR_TO_CLASS_B)[promotion_piece]
     
     logger.info("Waiting for promotion dialog to appear...")
     dialog_result = wait_for_promotion_dialog(color_indicator, max_wait_time=1.5, check_interval=0.15)
@@ -280,13 +434,15 @@ def handle_pawn_promotion(
         logger.error("Promotion dialog did not appear within timeout")
         return False
     
-    boxes, chessboard_box = dialog_result
+    boxes, chessboard_box, detected_pieces = dialog_result
     
     # Now that we've confirmed the dialog is visible, select the piece
     for attempt in range(max_retries):
         try:
-            # Find promotion pieces
-            promotion_pieces = find_promotion_dialog_pieces(boxes, chessboard_box, color_indicator)
+            # Order the pieces the dialog check already found; boxes only change on re-capture
+            promotion_pieces = find_promotion_dialog_pieces(
+                boxes, chessboard_box, color_indicator, promotion_pieces=detected_pieces
+            )
             if len(promotion_pieces) < 4:
                 logger.warning(f"Could not find all 4 promotion pieces (found {len(promotion_pieces)})")
                 if attempt < max_retries - 1:
@@ -294,32 +450,28 @@ def handle_pawn_promotion(
                     # Re-capture and try again
                     dialog_result = wait_for_promotion_dialog(color_indicator, max_wait_time=0.5, check_interval=0.1)
                     if dialog_result:
-                        boxes, chessboard_box = dialog_result
+                        boxes, chessboard_box, detected_pieces = dialog_result
                     continue
                 else:
                     break
             
             # Find the piece matching our promotion choice
-            selected_piece = None
-            for piece in promotion_pieces:
-                if piece['piece_char'].lower() == promotion_piece:
-                    selected_piece = piece
-                    break
+            selected_piece = next((p for p in promotion_pieces if p.class_id == target_class_id), None)
             
             if not selected_piece:
                 logger.warning(f"Could not find promotion piece '{promotion_piece}' in detected pieces")
-                logger.debug(f"Available pieces: {[p['piece_char'] for p in promotion_pieces]}")
+                logger.debug(f"Available pieces: {[p.piece_char for p in promotion_pieces]}")
                 if attempt < max_retries - 1:
                     time.sleep(0.2)
                     continue
                 else:
                     break
             
-            logger.debug(f"Selected promotion piece: {selected_piece['piece_char']} at position {selected_piece['position']}")
+            logger.debug(f"Selected promotion piece: {selected_piece.piece_char} at position {selected_piece.position}")
             
             # Click on the promotion piece
             if select_promotion_piece(
-                selected_piece['position'],
+                selected_piece.position,
                 move_mode=move_mode,
                 humanize=humanize,
                 offset_range=(-8, 8),
@@ -1,8 +1,9 @@
 import logging
-from PyQt6.QtCore import QTimer
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from board_detection import get_positions, get_fen_from_position
-from executor.capture_screenshot_in_memory import capture_screenshot_in_memory
+from executor.capture_screenshot_in_memory import capture_screenshot_in_memory, release_screen_capture
 from executor.get_best_move import get_best_move
 from executor.is_castling_possible import is_castling_possible
 from executor.update_fen_castling_rights import update_fen_castling_rights
@@ -13,14 +14,23 @@ from executor.verify_move import verify_move
 from executor.move_piece import move_piece
 from executor.is_two_square_king_move import is_two_square_king_move
 from executor.processing_sync import processing_event
+from executor.gui_bridge import gui_bridge, stop_auto_mode
 from core.config import AppConfig
 from executor.did_castling_move import did_castling_move 
+from executor.capture_square_pixels import capture_square_pixels
+from executor.chess_notation_to_index import chess_notation_to_index
+from executor.apply_uci_move import apply_uci_move
+from executor.expend_fen_row import expend_fen_row
 
 # Logger setup
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+# Grabs the next retry screenshot while the current one is still being analyzed
+_capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="board-capture")
+
+
 def process_move(
     root,
     color_indicator,
@@ -63,6 +73,8 @@ def process_move(
         _handle_processing_error(e, root, update_status, auto_mode_var)
     finally:
         _finalize_move_processing(root, auto_mode_var, btn_play)
+        # Each move runs on a fresh thread; don't leave its screen capture connection open
+        release_screen_capture()
 
 
 def _can_start_processing():
@@ -80,112 +92,150 @@ def _initialize_move_processing(root, btn_play, update_status):
     Set up the initial state for move processing.
     """
     processing_event.set()
-    QTimer.singleShot(0, lambda: btn_play.setEnabled(False))
-    QTimer.singleShot(0, lambda: update_status("\nAnalyzing board..."))
+    gui_bridge.button_enabled.emit(btn_play, False)
+    gui_bridge.status_update.emit(update_status, "\nAnalyzing board...")
 
 
 def _extract_board_position(root, auto_mode_var, color_indicator, update_status):
     """
     Capture screenshot and extract board position data with retry logic.
-    Returns board data dict or None if failed.
+    The next attempt's screenshot is taken in the background, FEN_RETRY_DELAY
+    after the current one, so detection overlaps the retry wait.
+    Returns a _BoardDetection or None if failed.
     """
     max_retries = AppConfig.MAX_FEN_EXTRACTION_RETRIES
+    retry_delay = AppConfig.FEN_RETRY_DELAY
+    next_capture = None
     
-    for attempt in range(max_retries):
-        logger.info(f"Capturing screenshot (attempt {attempt + 1}/{max_retries})")
-        screenshot_image = capture_screenshot_in_memory(root, auto_mode_var)
-        
-        if not screenshot_image:
-            logger.warning(f"Screenshot capture failed on attempt {attempt + 1}")
-            if attempt < max_retries - 1:
-                time.sleep(AppConfig.FEN_RETRY_DELAY)
-                continue
-            return None
-        
-        boxes = get_positions(screenshot_image)
-        if not boxes:
-            logger.error(f"No chessboard found in screenshot (attempt {attempt + 1})")
+    try:
+        for attempt in range(max_retries):
+            logger.info(f"Capturing screenshot (attempt {attempt + 1}/{max_retries})")
+            if next_capture is None:
+                screenshot_image = capture_screenshot_in_memory(root, auto_mode_var)
+            else:
+                screenshot_image = next_capture[0].result()
+                next_capture = None
+            
+            if not screenshot_image:
+                logger.warning(f"Screenshot capture failed on attempt {attempt + 1}")
+                if attempt < max_retries - 1:
+                    time.sleep(retry_delay)
+                    continue
+                return None
+            
             if attempt < max_retries - 1:
-                QTimer.singleShot(0, lambda: update_status(f"\nRetrying board detection ({attempt + 2}/{max_retries})…"))
-                time.sleep(AppConfig.FEN_RETRY_DELAY)
-                continue
+                next_capture = _prefetch_screenshot(root, auto_mode_var, retry_delay)
             
-            QTimer.singleShot(0, lambda: update_status("\nNo board detected after retries"))
-            if callable(auto_mode_var):
-                root.auto_mode_var = False
-                root.auto_mode_check.setChecked(False)
-            return None
-        
-        fen_data = _extract_fen_from_boxes(boxes, color_indicator, root, update_status, auto_mode_var, attempt, max_retries)
-        if fen_data:
-            return {
-                'boxes': boxes,
-                'chessboard_x': fen_data['chessboard_x'],
-                'chessboard_y': fen_data['chessboard_y'],
-                'square_size': fen_data['square_size'],
-                'fen': fen_data['fen']
-            }
+            boxes = get_positions(screenshot_image)
+            if not boxes:
+                logger.error(f"No chessboard found in screenshot (attempt {attempt + 1})")
+                if attempt < max_retries - 1:
+                    gui_bridge.status_update.emit(update_status, f"\nRetrying board detection ({attempt + 2}/{max_retries})…")
+                    continue
+                
+                gui_bridge.status_update.emit(update_status, "\nNo board detected after retries")
+                if callable(auto_mode_var):
+                    stop_auto_mode(root)
+                return None
+            
+            board_data = _extract_fen_from_boxes(boxes, color_indicator, root, update_status, auto_mode_var, attempt, max_retries)
+            if board_data:
+                return board_data
+            
+            # If FEN extraction failed and we have retries left
+            if attempt < max_retries - 1:
+                logger.warning(f"FEN extraction failed, retrying in {retry_delay}s…")
         
-        # If FEN extraction failed and we have retries left
-        if attempt < max_retries - 1:
-            logger.warning(f"FEN extraction failed, retrying in {AppConfig.FEN_RETRY_DELAY}s…")
-            time.sleep(AppConfig.FEN_RETRY_DELAY)
+        logger.error(f"Failed to extract board position after {max_retries} attempts")
+        return None
+    finally:
+        if next_capture is not None:
+            # Not needed any more; skip the grab if it hasn't happened yet
+            next_capture[1].set()
+
+
+def _prefetch_screenshot(root, auto_mode_var, delay):
+    """
+    Schedule a screenshot delay seconds from now on the capture thread.
+    Returns (future, cancel_event); setting the event before the delay
+    elapses makes the future resolve to None without grabbing the screen.
+    """
+    cancel_event = threading.Event()
+    
+    def capture():
+        if cancel_event.wait(delay):
+            return None
+        return capture_screenshot_in_memory(root, auto_mode_var)
     
-    logger.error(f"Failed to extract board position after {max_retries} attempts")
-    return None
+    return _capture_executor.submit(capture), cancel_event
+
+class _BoardDetection:
+    """Board geometry and FEN read from one set of detection boxes."""
+    __slots__ = ('boxes', 'chessboard_x', 'chessboard_y', 'square_size', 'fen', 'captured_at')
+
+    def __init__(self, boxes, chessboard_x, chessboard_y, square_size, fen):
+        self.boxes = boxes
+        self.chessboard_x = chessboard_x
+        self.chessboard_y = chessboard_y
+        self.square_size = square_size
+        self.fen = fen
+        # time.monotonic() when the board was read, to judge whether the FEN is still current
+        self.captured_at = time.monotonic()
+
+
+def _read_board(color_indicator, boxes):
+    """
+    Turn detection boxes into a _BoardDetection.
+    Returns None when no chessboard (class 12) was detected; extraction errors propagate.
+    Shared by the initial extraction and castling verification.
+    """
+    result = get_fen_from_position(color_indicator, boxes)
+    if result is None:
+        return None
+    return _BoardDetection(boxes, *result)
+
 
 def _extract_fen_from_boxes(boxes, color_indicator, root, update_status, auto_mode_var, attempt, max_retries):
     """
     Extract FEN from detected board boxes with proper error handling.
     """
     try:
-        result = get_fen_from_position(color_indicator, boxes)
+        board = _read_board(color_indicator, boxes)
         
-        if result is None:
+        if board is None:
             logger.error(f"FEN extraction failed: get_fen_from_position returned None (attempt {attempt + 1})")
             if attempt < max_retries - 1:
-                QTimer.singleShot(0, lambda: update_status(f"Retrying FEN extraction ({attempt + 2}/{max_retries})…"))
+                gui_bridge.status_update.emit(update_status, f"Retrying FEN extraction ({attempt + 2}/{max_retries})…")
             else:
-                QTimer.singleShot(0, lambda: update_status("Error: Could not detect board/FEN"))
+                gui_bridge.status_update.emit(update_status, "Error: Could not detect board/FEN")
                 if callable(auto_mode_var):
-                    root.auto_mode_var = False
-                    root.auto_mode_check.setChecked(False)
+                    stop_auto_mode(root)
             return None
         
-        chessboard_x, chessboard_y, square_size, fen = result
-        logger.debug(f"FEN extracted successfully: {fen}")
-        
-        return {
-            'chessboard_x': chessboard_x,
-            'chessboard_y': chessboard_y,
-            'square_size': square_size,
-            'fen': fen
-        }
+        logger.debug("FEN extracted successfully: %s", board.fen)
+        return board
         
     except IndexError as e:
         logger.error(f"FEN extraction failed: unexpected box format (attempt {attempt + 1}): {e}")
         if attempt >= max_retries - 1:
-            QTimer.singleShot(0, lambda: update_status("Error: Bad screenshot"))
+            gui_bridge.status_update.emit(update_status, "Error: Bad screenshot")
             if callable(auto_mode_var):
-                root.auto_mode_var = False
-                root.auto_mode_check.setChecked(False)
+                stop_auto_mode(root)
         return None
         
     except ValueError as e:
         logger.error(f"FEN extraction failed (attempt {attempt + 1}): {e}")
         if attempt >= max_retries - 1:
-            QTimer.singleShot(0, lambda err=e: update_status(f"Error: {str(err)}"))
+            gui_bridge.status_update.emit(update_status, f"Error: {str(e)}")
             if callable(auto_mode_var):
-                root.auto_mode_var = False
-                root.auto_mode_check.setChecked(False)
+                stop_auto_mode(root)
         return None
     except Exception as e:
         logger.error(f"Unexpected error during FEN extraction (attempt {attempt + 1}): {e}", exc_info=True)
         if attempt >= max_retries - 1:
-            QTimer.singleShot(0, lambda err=e: update_status(f"Error: {str(err)}"))
+            gui_bridge.status_update.emit(update_status, f"Error: {str(e)}")
             if callable(auto_mode_var):
-                root.auto_mode_var = False
-                root.auto_mode_check.setChecked(False)
+                stop_auto_mode(root)
         return None
 
 
@@ -214,7 +264,7 @@ def _process_best_move(
     _execute_move(
         best_move, fen, updated_fen, mate_flag, color_indicator,
         board_positions, auto_mode_var, root, btn_play, move_mode, update_status,
-        kingside_var, queenside_var, last_fen_by_color
+        kingside_var, queenside_var, last_fen_by_color, board_data.captured_at
     )
 
 
@@ -223,15 +273,15 @@ def _prepare_position_data(board_data, color_indicator, kingside_var, queenside_
     Update FEN with castling rights and store board position data.
     """
     fen = update_fen_castling_rights(
-        color_indicator, kingside_var, queenside_var, board_data['fen']
+        color_indicator, kingside_var, queenside_var, board_data.fen
     )
-    logger.debug(f"FEN after castling update: {fen}")
+    logger.debug("FEN after castling update: %s", fen)
     
     store_board_positions(
         board_positions, 
-        board_data['chessboard_x'], 
-        board_data['chessboard_y'], 
-        board_data['square_size']
+        board_data.chessboard_x, 
+        board_data.chessboard_y, 
+        board_data.square_size
     )
     
     return fen
@@ -248,7 +298,7 @@ def _calculate_best_move(root, fen, auto_mode_var, update_status):
     
     if not best_move:
         logger.warning("No move returned by engine.")
-        QTimer.singleShot(0, lambda: update_status("No valid move found!"))
+        gui_bridge.status_update.emit(update_status, "No valid move found!")
         return None
     
     logger.info(f"Best move suggested: {best_move}")
@@ -258,7 +308,7 @@ def _calculate_best_move(root, fen, auto_mode_var, update_status):
 def _execute_move(
     best_move, fen, updated_fen, mate_flag, color_indicator,
     board_positions, auto_mode_var, root, btn_play, move_mode, update_status,
-    kingside_var, queenside_var, last_fen_by_color
+    kingside_var, queenside_var, last_fen_by_color, fen_captured_at
 ):
     """
     Execute either a castling move or normal move based on detection.
@@ -269,7 +319,7 @@ def _execute_move(
         _execute_castling_move(
             best_move, side, fen, updated_fen, mate_flag, color_indicator,
             board_positions, auto_mode_var, root, btn_play, move_mode, update_status,
-            kingside_var, queenside_var, last_fen_by_color
+            kingside_var, queenside_var, last_fen_by_color, fen_captured_at
         )
     else:
         logger.info("Executing normal (non-castling) move.")
@@ -293,7 +343,7 @@ def _should_execute_castling(is_castle_move, kingside_var, queenside_var):
 def _execute_castling_move(
     best_move, side, fen, updated_fen, mate_flag, color_indicator,
     board_positions, auto_mode_var, root, btn_play, move_mode, update_status,
-    kingside_var, queenside_var, last_fen_by_color
+    kingside_var, queenside_var, last_fen_by_color, fen_captured_at
 ):
     """
     Execute a castling move with all necessary checks and updates.
@@ -307,7 +357,8 @@ def _execute_castling_move(
     if is_castling_possible(fen, color_indicator, side):
         _perform_castling_move(
             best_move, updated_fen, mate_flag, color_indicator,
-            board_positions, auto_mode_var, root, btn_play, move_mode, update_status, last_fen_by_color
+            board_positions, auto_mode_var, root, btn_play, move_mode, update_status, last_fen_by_color,
+            fen, fen_captured_at
         )
     else:
         logger.warning("Castling not possible according to board state.")
@@ -322,29 +373,37 @@ def _auto_enable_castling_checkbox(side, kingside_var, queenside_var, root, upda
 
     if side == "kingside" and not k_val:
         logger.info("Auto-checking 'Kingside Castle' checkbox")
-        root.kingside_check.setChecked(True)
-        QTimer.singleShot(0, lambda: update_status("Auto-enabled Kingside Castle"))
+        gui_bridge.checked.emit(root.kingside_check, True)
+        gui_bridge.status_update.emit(update_status, "Auto-enabled Kingside Castle")
     elif side == "queenside" and not q_val:
         logger.info("Auto-checking 'Queenside Castle' checkbox")
-        root.queenside_check.setChecked(True)
-        QTimer.singleShot(0, lambda: update_status("Auto-enabled Queenside Castle"))
+        gui_bridge.checked.emit(root.queenside_check, True)
+        gui_bridge.status_update.emit(update_status, "Auto-enabled Queenside Castle")
 
 
 def _perform_castling_move(
     best_move, updated_fen, mate_flag, color_indicator,
-    board_positions, auto_mode_var, root, btn_play, move_mode, update_status, last_fen_by_color
+    board_positions, auto_mode_var, root, btn_play, move_mode, update_status, last_fen_by_color,
+    fen=None, fen_captured_at=None
 ):
     """
     Perform the actual castling move with retry logic and verification.
+    The first attempt starts from fen, the position the move was searched on,
+    when it was captured recently enough; retries always read the board again.
     """
+    if fen_captured_at is None or time.monotonic() - fen_captured_at > AppConfig.CASTLING_FEN_MAX_AGE:
+        fen = None
     logger.info(f"Attempting castling move: {best_move} for {color_indicator}")
     max_retries = 3
+    rook_move = _derive_castling_rook_move(best_move, color_indicator)
+    skip_verification = AppConfig.SKIP_VERIFICATION_ON_FAILURE
 
     for attempt in range(1, max_retries + 1):
-        logger.debug(f"[Castling Attempt {attempt}/{max_retries}] Starting move sequence")
+        logger.debug("[Castling Attempt %s/%s] Starting move sequence", attempt, max_retries)
         
-        # Get board state before move
-        original_fen = get_current_fen(color_indicator)
+        # Get board state before move; a failed attempt may have moved a piece, so only reuse once
+        original_fen = fen or get_current_fen(color_indicator)
+        fen = None
         if not original_fen:
             logger.warning("Could not fetch original FEN, retrying...")
             time.sleep(0.2)
@@ -352,13 +411,13 @@ def _perform_castling_move(
         
         # Execute the castling move (king + rook)
         _execute_castling_pieces(
-            best_move, color_indicator, board_positions,
+            best_move, rook_move, color_indicator, board_positions,
             auto_mode_var, root, btn_play, move_mode
         )
         
         # Verify the move was successful
         verification_result = _verify_castling_execution(
-            color_indicator, original_fen, best_move
+            color_indicator, original_fen, best_move, rook_move, board_positions
         )
         
         if verification_result['verified']:
@@ -369,7 +428,7 @@ def _perform_castling_move(
             return True
         
         # Handle unverified move with skip flag
-        if AppConfig.SKIP_VERIFICATION_ON_FAILURE:
+        if skip_verification:
             _handle_unverified_castling(
                 best_move, mate_flag, update_status, auto_mode_var, root
             )
@@ -383,23 +442,31 @@ def _perform_castling_move(
     return False
 
 
+# (is white, is kingside) -> rook move
+_ROOK_MOVE_LUT = {
+    (True, True): "h1f1",
+    (True, False): "a1d1",
+    (False, True): "h8f8",
+    (False, False): "a8d8",
+}
+
+
+def _derive_castling_rook_move(king_move, color_indicator):
+    """
+    Rook move that goes with a castling king move.
+    """
+    # Determine castling side from the king's move
+    is_kingside = king_move[2] > king_move[0]
+    return _ROOK_MOVE_LUT[(color_indicator == "w", is_kingside)]
+
+
 def _execute_castling_pieces(
-    best_move, color_indicator, board_positions,
+    best_move, rook_move, color_indicator, board_positions,
     auto_mode_var, root, btn_play, move_mode
 ):
     """
     Execute both king and rook moves for castling.
     """
-    # Determine castling side from the king's move
-    from_file, to_file = best_move[0], best_move[2]
-    is_kingside = ord(to_file) > ord(from_file)
-    
-    # Calculate rook move based on castling side and color
-    if color_indicator == "w":
-        rook_move = "h1f1" if is_kingside else "a1d1"
-    else:  # black
-        rook_move = "h8f8" if is_kingside else "a8d8"
-    
     logger.info(f"Executing castling: King move {best_move}, Rook move {rook_move}")
     
     # Move the king first
@@ -409,42 +476,105 @@ def _execute_castling_pieces(
     # Move the rook
     move_piece(color_indicator, rook_move, board_positions, auto_mode_var, root, btn_play, move_mode)
     
-    # Wait for move animation to complete
-    delay = 0.4 if move_mode == "click" else 0.1
-    time.sleep(delay)
+    # Wait for move animation to complete, at most the old fixed delay
+    delay = AppConfig.CLICK_MOVE_SETTLE_DELAY if move_mode == "click" else AppConfig.DRAG_MOVE_SETTLE_DELAY
+    _wait_until_stable(_castling_region(color_indicator, best_move, rook_move, board_positions), delay)
 
 
-def _verify_castling_execution(color_indicator, original_fen, king_move):
+def _castling_region(color_indicator, king_move, rook_move, board_positions):
+    """
+    Center and half size of a screen region covering the king and rook destination squares.
+    Returns None if the squares can't be located.
+    """
+    king_to, rook_to = chess_notation_to_index(color_indicator, None, None, king_move[2:4] + rook_move[2:4])
+    if king_to is None or king_to not in board_positions or rook_to not in board_positions:
+        return None
+    (kx, ky), (rx, ry) = board_positions[king_to], board_positions[rook_to]
+    # Adjacent squares: their centers are one square apart
+    half_size = int(max(abs(kx - rx), abs(ky - ry)))
+    return ((kx + rx) / 2, (ky + ry) / 2), half_size
+
+
+def _wait_until_stable(region, max_wait):
+    """
+    Wait until two consecutive grabs of region are identical, for at most max_wait seconds.
+    Falls back to sleeping max_wait when the region can't be grabbed (e.g. Wayland).
+    """
+    deadline = time.monotonic() + max_wait
+    poll_interval = AppConfig.MOVE_SETTLE_POLL_INTERVAL
+    previous = capture_square_pixels(*region) if region else None
+    if previous is None:
+        time.sleep(max_wait)
+        return
+    
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(poll_interval, remaining))
+        current = capture_square_pixels(*region)
+        if current is None:
+            time.sleep(max(deadline - time.monotonic(), 0))
+            return
+        if current == previous:
+            logger.debug("Castling squares settled")
+            return
+        previous = current
+
+
+def _verify_castling_execution(color_indicator, original_fen, king_move, rook_move, board_positions=None):
     """
     Verify that the castling move was successfully executed.
     """
     max_verify_attempts = 2
     
-    from_file, to_file = king_move[0], king_move[2]
-    is_kingside = ord(to_file) > ord(from_file)
+    region = _castling_region(color_indicator, king_move, rook_move, board_positions) if board_positions else None
     
-    if color_indicator == "w":
-        rook_move = "h1f1" if is_kingside else "a1d1"
-    else:  # black
-        rook_move = "h8f8" if is_kingside else "a8d8"
+    # What the king and rook squares must show once castled; each poll then only checks those four
+    try:
+        expected_squares = _castling_squares(apply_uci_move(original_fen, king_move).split()[0], king_move, rook_move)
+    except (ValueError, IndexError) as e:
+        logger.debug("Could not precompute castled squares (%s), using did_castling_move", e)
+        expected_squares = None
     
     for verify_attempt in range(max_verify_attempts):
-        time.sleep(0.2)  # Delay before verification
+        _wait_until_stable(region, 0.2)  # Let the animation finish before verification
         
         current_fen = _capture_and_extract_fen(color_indicator, verify_attempt)
         if not current_fen:
             continue
         
-        logger.debug(f"Checking if castling move registered: King {king_move}, Rook {rook_move}")
-        if did_castling_move(color_indicator, original_fen, current_fen, king_move, rook_move):
+        logger.debug("Checking if castling move registered: King %s, Rook %s", king_move, rook_move)
+        if expected_squares is not None:
+            castled = _castling_squares(current_fen.split(' ', 1)[0], king_move, rook_move) == expected_squares
+        else:
+            castled = did_castling_move(color_indicator, original_fen, current_fen, king_move, rook_move)
+        if castled:
             logger.info(f"Castling move executed successfully: King {king_move}, Rook {rook_move}")
             return {'verified': True, 'current_fen': current_fen}
         
-        logger.debug(f"Castling move not yet registered on attempt {verify_attempt + 1}")
+        logger.debug("Castling move not yet registered on attempt %s", verify_attempt + 1)
     
     return {'verified': False, 'current_fen': None}
 
 
+def _castling_squares(placement, king_move, rook_move):
+    """
+    Pieces on the king and rook from/to squares of placement, in that order.
+    Other squares are ignored so detection noise elsewhere doesn't fail the castle.
+    Returns None for a malformed placement.
+    """
+    ranks = placement.split('/')
+    if len(ranks) != 8:
+        return None
+    pieces = []
+    for square in (king_move[0:2], king_move[2:4], rook_move[0:2], rook_move[2:4]):
+        row = expend_fen_row(ranks[8 - int(square[1])])
+        file = ord(square[0]) - ord('a')
+        pieces.append(row[file] if file < len(row) else None)
+    return tuple(pieces)
+
+
 def _capture_and_extract_fen(color_indicator, verify_attempt):
     """
     Capture screenshot and extract FEN from current board state.
@@ -460,18 +590,13 @@ def _capture_and_extract_fen(color_indicator, verify_attempt):
         logger.warning(f"Board detection failed on verification attempt {verify_attempt + 1}")
         return None
     
-    if not any(box[5] == 12.0 for box in boxes):
-        logger.warning(f"No chessboard detected on verification attempt {verify_attempt + 1}")
-        return None
-    
     try:
-        result = get_fen_from_position(color_indicator, boxes)
-        if result is None:
+        board = _read_board(color_indicator, boxes)
+        if board is None:
             logger.warning(f"FEN extraction returned None on verification attempt {verify_attempt + 1}")
             return None
         
-        _, _, _, current_fen = result
-        return current_fen
+        return board.fen
     except (ValueError, TypeError) as e:
         logger.warning(f"FEN extraction error on verification attempt {verify_attempt + 1}: {e}")
         return None
@@ -485,14 +610,14 @@ def _handle_successful_castling(move, mate_flag, current_fen, update_status, aut
     
     if mate_flag:
         status += "\n𝘾𝙝𝙚𝙘𝙠𝙢𝙖𝙩𝙚"
-        _disable_auto_mode(auto_mode_var, root)
+        stop_auto_mode(root, enable_play=True)
         logger.info("Checkmate detected. Auto mode disabled.")
     
     # Update last FEN
     if current_fen:
         last_fen_by_color[color_indicator] = current_fen.split()[0]
     
-    update_status(status)
+    gui_bridge.status_update.emit(update_status, status)
     logger.info("Castling move verified and updated.")
 
 
@@ -508,8 +633,8 @@ def _handle_unverified_castling(move, mate_flag, update_status, auto_mode_var, r
     if mate_flag:
         status += "\n𝘾𝙝𝙚𝙘𝙠𝙢𝙖𝙩𝙚"
     
-    update_status(status)
-    _disable_auto_mode(auto_mode_var, root)
+    gui_bridge.status_update.emit(update_status, status)
+    stop_auto_mode(root, enable_play=True)
     logger.info("Auto mode disabled due to unverified castling move")
 
 
@@ -518,52 +643,23 @@ def _handle_castling_failure(move, max_retries, update_status, auto_mode_var, ro
     Handle complete castling failure after all retries.
     """
     logger.error(f"Castling move {move} failed after {max_retries} attempts")
-    update_status(
+    gui_bridge.status_update.emit(
+        update_status,
         f"Move failed to register after {max_retries} attempts\n"
         f"Check board detection settings"
     )
-    _disable_auto_mode(auto_mode_var, root)
+    stop_auto_mode(root, enable_play=True)
     logger.info("Auto mode disabled due to castling failure")
 
 
-def _disable_auto_mode(auto_mode_var, root):
-    """
-    Disable auto mode by setting the variable and unchecking the checkbox.
-    Matches the pattern used in execute_normal_move.py
-    """
-    try:
-        if root is not None:
-            # Set the variable
-            if hasattr(root, "auto_mode_var"):
-                root.auto_mode_var = False
-                logger.info("Set auto_mode_var to False")
-            
-            # Uncheck the checkbox
-            if hasattr(root, "auto_mode_check"):
-                root.auto_mode_check.setChecked(False)
-                logger.info("Unchecked auto_mode_check checkbox")
-            
-            # Re-enable the play button
-            if hasattr(root, "btn_play"):
-                root.btn_play.setEnabled(True)
-                logger.info("Re-enabled play button")
-        
-        # Also try to set via the auto_mode_var parameter if it has a set method
-        if hasattr(auto_mode_var, "set") and callable(auto_mode_var.set):
-            auto_mode_var.set(False)
-            
-    except Exception as e:
-        logger.error(f"Error disabling auto mode: {e}", exc_info=True)
-
 def _handle_processing_error(error, root, update_status, auto_mode_var):
     """
     Handle unexpected errors during move processing.
     """
     logger.exception("Unexpected error during process_move")
-    QTimer.singleShot(0, lambda err=error: update_status(f"Error: {str(err)}"))
+    gui_bridge.status_update.emit(update_status, f"Error: {str(error)}")
     if callable(auto_mode_var):
-        root.auto_mode_var = False
-        root.auto_mode_check.setChecked(False)
+        stop_auto_mode(root)
 
 
 def _finalize_move_processing(root, auto_mode_var, btn_play):
@@ -573,5 +669,5 @@ def _finalize_move_processing(root, auto_mode_var, btn_play):
     processing_event.clear()
     auto_val = auto_mode_var() if callable(auto_mode_var) else auto_mode_var
     if not auto_val:
-        QTimer.singleShot(0, lambda: btn_play.setEnabled(True))
+        gui_bridge.button_enabled.emit(btn_play, True)
     logger.info("process_move completed.")
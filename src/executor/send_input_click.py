@@ -0,0 +1,79 @@
+import ctypes
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+if os.name == 'nt':
+    from ctypes import wintypes
+
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_VIRTUALDESK = 0x4000
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+
+    # Virtual desktop metrics, so coordinates match SetCursorPos on multi-monitor setups
+    SM_XVIRTUALSCREEN = 76
+    SM_YVIRTUALSCREEN = 77
+    SM_CXVIRTUALSCREEN = 78
+    SM_CYVIRTUALSCREEN = 79
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    # MOUSEINPUT is the largest member of the INPUT union, so it alone gives the right size
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _anonymous_ = ("u",)
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _user32.SendInput.restype = wintypes.UINT
+
+
+def _mouse_input(flags, dx=0, dy=0):
+    return INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dx=dx, dy=dy, mouseData=0, dwFlags=flags, time=0, dwExtraInfo=0))
+
+
+def _send(*inputs):
+    array = (INPUT * len(inputs))(*inputs)
+    sent = _user32.SendInput(len(inputs), array, ctypes.sizeof(INPUT))
+    if sent != len(inputs):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def send_input_click(x, y, hold=0.016):
+    """
+    Left-click at screen coordinates (x, y) on Windows using SendInput.
+    The move and button press go in one call; the release follows after hold seconds.
+    """
+    left = _user32.GetSystemMetrics(SM_XVIRTUALSCREEN)
+    top = _user32.GetSystemMetrics(SM_YVIRTUALSCREEN)
+    width = _user32.GetSystemMetrics(SM_CXVIRTUALSCREEN)
+    height = _user32.GetSystemMetrics(SM_CYVIRTUALSCREEN)
+
+    # Absolute coordinates are normalized to 0..65535 across the virtual desktop
+    dx = int(round((x - left) * 65535 / max(width - 1, 1)))
+    dy = int(round((y - top) * 65535 / max(height - 1, 1)))
+    logger.debug(f"SendInput click at ({x}, {y}) -> normalized ({dx}, {dy})")
+
+    _send(
+        _mouse_input(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK, dx, dy),
+        _mouse_input(MOUSEEVENTF_LEFTDOWN),
+    )
+    time.sleep(hold)
+    _send(_mouse_input(MOUSEEVENTF_LEFTUP))
@@ -1,10 +1,21 @@
+# (board_positions dict, x, y, size) it was last filled for; the board rarely moves between turns
+_last_layout = None
+
+
 def store_board_positions(board_positions, x, y, size):
-    chessboard_x = x
-    chessboard_y = y
-    square_size = size
+    global _last_layout
+
+    layout = (id(board_positions), x, y, size)
+    if layout == _last_layout and len(board_positions) == 64:
+        return
+
+    # Square centers along each axis, computed once instead of per square
+    half = size // 2
+    xs = [x + col * size + half for col in range(8)]
+    ys = [y + row * size + half for row in range(8)]
+
     board_positions.clear()
-    for row in range(8):
-        for col in range(8):
-            pos_x = x + col * size + (size // 2)
-            pos_y = y + row * size + (size // 2)
-            board_positions[(col, row)] = (pos_x, pos_y)
\ No newline at end of file
+    for row, pos_y in enumerate(ys):
+        for col, pos_x in enumerate(xs):
+            board_positions[(col, row)] = (pos_x, pos_y)
+    _last_layout = layout
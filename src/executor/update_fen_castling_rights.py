@@ -1,5 +1,5 @@
 import logging
-from executor.is_castling_possible import is_castling_possible
+from executor.expend_fen_row import expend_fen_row
 
 # Logger setup
 logger = logging.getLogger(__name__)
@@ -12,78 +12,92 @@ def update_fen_castling_rights(color_indicator, kingside_var, queenside_var, fen
     """
     logger.debug(f"Original FEN: {fen}")
     
-    fen_fields = _validate_and_parse_fen(fen)
-    if not fen_fields:
+    if not _validate_fen(fen):
         return fen
     
-    new_castling = _build_castling_rights(color_indicator, kingside_var, queenside_var, fen)
+    # Resolve each checkbox once; both colors' rights are built from these values
+    kingside = _get_var_value(kingside_var)
+    queenside = _get_var_value(queenside_var)
+    new_castling = _build_castling_rights(color_indicator, kingside, queenside, fen)
     
-    return _reconstruct_fen_with_castling(fen_fields, new_castling)
+    # Nothing to splice when the FEN already carries these rights (e.g. "-" late in the game)
+    if new_castling == _castling_field(fen):
+        logger.debug(f"Castling field already {new_castling}, FEN unchanged")
+        return fen
+    
+    return _reconstruct_fen_with_castling(fen, new_castling)
 
 
-def _validate_and_parse_fen(fen):
+def _validate_fen(fen):
     """
-    Validate FEN format and return parsed fields.
+    Validate FEN format: six space-separated fields.
     """
-    fields = fen.split()
-    if len(fields) < 6:
+    if fen.count(" ") < 5:
         logger.error(f"Malformed FEN: {fen}")
-        return None
-    return fields
+        return False
+    return True
 
 
-def _build_castling_rights(color_indicator, kingside_var, queenside_var, fen):
+# Castling rights as a 4-bit mask: K, Q, k, q
+_WHITE_KINGSIDE, _WHITE_QUEENSIDE, _BLACK_KINGSIDE, _BLACK_QUEENSIDE = 8, 4, 2, 1
+_COLOR_MASK = {"w": _WHITE_KINGSIDE | _WHITE_QUEENSIDE, "b": _BLACK_KINGSIDE | _BLACK_QUEENSIDE}
+_MASK_TO_STR = [
+    "".join(symbol for bit, symbol in zip((8, 4, 2, 1), "KQkq") if mask & bit) or "-"
+    for mask in range(16)
+]
+
+
+def _build_castling_rights(color_indicator, kingside, queenside, fen):
     """
     Build the complete castling rights string for both colors.
+    kingside / queenside are the player's already-resolved checkbox values.
     """
-    white_castling = _get_color_castling_rights("w", color_indicator, kingside_var, queenside_var, fen)
-    black_castling = _get_color_castling_rights("b", color_indicator, kingside_var, queenside_var, fen)
+    possible = _possible_castling_mask(fen)
+    
+    # The opponent keeps every right the board allows; the player only the ticked ones
+    if color_indicator == "w":
+        player = (_WHITE_KINGSIDE if kingside else 0) | (_WHITE_QUEENSIDE if queenside else 0)
+    else:
+        player = (_BLACK_KINGSIDE if kingside else 0) | (_BLACK_QUEENSIDE if queenside else 0)
+    allowed = (15 & ~_COLOR_MASK.get(color_indicator, 0)) | player
     
-    combined_castling = white_castling + black_castling
-    return combined_castling or "-"
+    return _MASK_TO_STR[possible & allowed]
 
 
-def _get_color_castling_rights(target_color, player_color, kingside_var, queenside_var, fen):
+def _possible_castling_mask(fen):
     """
-    Get castling rights string for a specific color (white or black).
+    Rights the piece placement still allows: king and rook on their home squares.
+    Parses the two back ranks once instead of once per color and side.
     """
-    castling_symbols = _get_castling_symbols(target_color)
-    castling_rights = ""
+    rows = fen.split(" ", 1)[0].split("/")
+    mask = 0
     
-    # Check kingside castling
-    if _should_add_castling_right(target_color, "kingside", player_color, kingside_var, fen):
-        castling_rights += castling_symbols["kingside"]
+    # A rook on the a/h file is the first/last character of the rank, so a
+    # rank without one is skipped before expanding it
+    white_rank = rows[-1]
+    if white_rank[:1] == "R" or white_rank[-1:] == "R":
+        white_row = expend_fen_row(white_rank)
+        if len(white_row) == 8 and white_row[4] == "K":
+            if white_row[7] == "R":
+                mask |= _WHITE_KINGSIDE
+            if white_row[0] == "R":
+                mask |= _WHITE_QUEENSIDE
     
-    # Check queenside castling
-    if _should_add_castling_right(target_color, "queenside", player_color, queenside_var, fen):
-        castling_rights += castling_symbols["queenside"]
+    black_rank = rows[0]
+    if black_rank[:1] == "r" or black_rank[-1:] == "r":
+        black_row = expend_fen_row(black_rank)
+        if len(black_row) == 8 and black_row[4] == "k":
+            if black_row[7] == "r":
+                mask |= _BLACK_KINGSIDE
+            if black_row[0] == "r":
+                mask |= _BLACK_QUEENSIDE
     
-    return castling_rights
+    logger.debug(f"Castling possible by placement: {_MASK_TO_STR[mask]}")
+    return mask
 
 
-def _get_castling_symbols(color):
-    """
-    Get the appropriate castling symbols for the given color.
-    """
-    if color == "w":
-        return {"kingside": "K", "queenside": "Q"}
-    else:  # color == "b"
-        return {"kingside": "k", "queenside": "q"}
-
-
-def _should_add_castling_right(target_color, side, player_color, side_var, fen):
-    """
-    Determine if castling right should be added for the given color and side.
-    """
-    if not is_castling_possible(fen, target_color, side):
-        return False
-    
-    # If it's the player's color, check if the corresponding variable is set
-    if target_color == player_color:
-        return _get_var_value(side_var)
-    
-    # If it's not the player's color, always include if possible
-    return True
+# Extractor per variable type, so repeated lookups skip the hasattr ladder
+_VAR_EXTRACTOR_CACHE = {}
 
 
 def _get_var_value(var):
@@ -97,54 +111,98 @@ def _get_var_value(var):
     - Objects with .value attribute
     - Direct boolean values
     """
-    # If it's callable, call it to get the value
-    if callable(var):
+    # Callables may return another var-like object; unwrap them in a loop, not by recursion
+    while True:
+        var_type = type(var)
+        extractor = _VAR_EXTRACTOR_CACHE.get(var_type)
+        if extractor is None:
+            extractor, type_decides = _pick_extractor(var)
+            if type_decides:
+                _VAR_EXTRACTOR_CACHE[var_type] = extractor
+        if extractor is not _CALL:
+            return extractor(var)
+        
+        # If it's callable, call it to get the value
         try:
-            result = var()
-            # The result might be another object, so recursively check
-            if callable(result) or hasattr(result, 'get') or hasattr(result, 'isChecked') or hasattr(result, 'value'):
-                return _get_var_value(result)
-            return bool(result)
+            var = var()
         except Exception as e:
             logger.warning(f"Error calling variable function: {e}")
             return False
+
+
+# Marker extractor: the variable has to be called and its result resolved again
+_CALL = object()
+
+
+def _pick_extractor(var):
+    """
+    Walk the callable / isChecked / get / value / bool ladder once for var.
+    Returns (extractor, type_decides); the choice is only cached when it
+    doesn't depend on attributes set on this particular instance.
+    """
+    if callable(var):
+        return _CALL, True
     
-    # Try .isChecked() method (for PyQt6 checkboxes)
-    if hasattr(var, 'isChecked'):
-        try:
-            return bool(var.isChecked())
-        except Exception as e:
-            logger.warning(f"Error calling .isChecked() on variable: {e}")
-            return False
-    
-    # Try .get() method (for Tkinter variables, etc.)
-    if hasattr(var, 'get'):
-        try:
-            return bool(var.get())
-        except Exception as e:
-            logger.warning(f"Error calling .get() on variable: {e}")
-            return False
-    
-    # Try .value attribute
-    if hasattr(var, 'value'):
-        try:
-            return bool(var.value)
-        except Exception as e:
-            logger.warning(f"Error accessing .value on variable: {e}")
-            return False
+    for attr, extractor in _ATTR_EXTRACTORS:
+        if hasattr(var, attr):
+            return extractor, hasattr(type(var), attr)
     
     # Direct boolean value
-    return bool(var)
+    return bool, not hasattr(var, '__dict__')
+
+
+def _is_checked_var(var):
+    # PyQt6 checkboxes
+    try:
+        return bool(var.isChecked())
+    except Exception as e:
+        logger.warning(f"Error calling .isChecked() on variable: {e}")
+        return False
+
+
+def _get_method_var(var):
+    # Tkinter variables, etc.
+    try:
+        return bool(var.get())
+    except Exception as e:
+        logger.warning(f"Error calling .get() on variable: {e}")
+        return False
+
+
+def _value_attr_var(var):
+    try:
+        return bool(var.value)
+    except Exception as e:
+        logger.warning(f"Error accessing .value on variable: {e}")
+        return False
+
+
+_ATTR_EXTRACTORS = (
+    ('isChecked', _is_checked_var),
+    ('get', _get_method_var),
+    ('value', _value_attr_var),
+)
+
+
+def _castling_field(fen):
+    """
+    Return the third FEN field (castling rights) without splitting the whole string.
+    """
+    second_space = fen.find(" ", fen.find(" ") + 1)
+    third_space = fen.find(" ", second_space + 1)
+    return fen[second_space + 1:third_space]
 
 
-def _reconstruct_fen_with_castling(fen_fields, new_castling):
+def _reconstruct_fen_with_castling(fen, new_castling):
     """
     Reconstruct the FEN string with updated castling rights.
+    Only the third field is replaced, by slicing between the 2nd and 3rd spaces.
     """
     logger.debug(f"Updated castling field: {new_castling}")
     
-    fen_fields[2] = new_castling
-    updated_fen = " ".join(fen_fields)
+    second_space = fen.find(" ", fen.find(" ") + 1)
+    third_space = fen.find(" ", second_space + 1)
+    updated_fen = f"{fen[:second_space + 1]}{new_castling}{fen[third_space:]}"
     
     logger.info(f"Updated FEN: {updated_fen}")
-    return updated_fen
\ No newline at end of file
+    return updated_fen
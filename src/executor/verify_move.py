@@ -1,5 +1,6 @@
 import time
 import logging
+import numpy as np
 from board_detection import get_positions, get_fen_from_position
 from executor import capture_screenshot_in_memory
 
@@ -15,6 +16,10 @@ def verify_move(color_indicator, _, expected_fen, attempts_limit=3):
     expected_pieces = expected_fen.split()[0]
     logger.debug(f"Starting move verification for color {color_indicator} with expected pieces: {expected_pieces}")
     
+    # What the last failed attempt saw; an identical board can't verify now either.
+    # get_positions already reuses detections for unchanged board pixels.
+    last_boxes = None
+    
     for attempt in range(1, attempts_limit + 1):
         if attempt > 1:
             time.sleep(0.5)
@@ -30,11 +35,16 @@ def verify_move(color_indicator, _, expected_fen, attempts_limit=3):
             logger.warning(f"Attempt {attempt}: Board detection failed - no objects detected")
             continue
         
-        chessboard_detected = any(box[5] == 12.0 for box in boxes)
-        if not chessboard_detected:
+        chessboard = next((box for box in boxes if box[5] == 12.0), None)
+        if chessboard is None:
             logger.warning(f"Attempt {attempt}: No chessboard detected (class_id 12.0 not found)")
             continue
         
+        if last_boxes is not None and _boxes_match(boxes, last_boxes):
+            logger.debug(f"Attempt {attempt}: Detections unchanged, skipping FEN extraction")
+            continue
+        last_boxes = boxes
+        
         try:
             result = get_fen_from_position(color_indicator, boxes)
             if result is None:
@@ -66,3 +76,27 @@ def verify_move(color_indicator, _, expected_fen, attempts_limit=3):
     logger.error("  2. Screenshot not capturing the chess board")
     logger.error("  3. Board animation still in progress")
     return False, attempts_limit
+
+
+def _boxes_match(boxes, previous, tolerance=2.0):
+    """
+    True if both detections hold the same classes with centers no more than tolerance pixels apart.
+    """
+    if len(boxes) != len(previous):
+        return False
+    current = _box_centers(boxes)
+    before = _box_centers(previous)
+    if not np.array_equal(current[:, 2], before[:, 2]):
+        return False
+    return bool(np.all(np.abs(current[:, :2] - before[:, :2]) <= tolerance))
+
+
+def _box_centers(boxes):
+    """
+    (cx, cy, class_id) rows, ordered so the same pieces line up between frames.
+    """
+    arr = np.asarray(boxes, dtype=np.float64).reshape(-1, 6)
+    centers = np.column_stack((arr[:, 0] + arr[:, 2] / 2, arr[:, 1] + arr[:, 3] / 2, arr[:, 5]))
+    # Group by class, then by rounded position within the class
+    order = np.lexsort((np.round(centers[:, 0] / 8), np.round(centers[:, 1] / 8), centers[:, 2]))
+    return centers[order]
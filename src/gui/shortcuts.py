@@ -1,13 +1,16 @@
 from PyQt6.QtGui import QShortcut, QKeySequence
 from PyQt6.QtCore import Qt
+from functools import partial
 import logging
+from gui.create_widget import move_depth_slider
 
 logger = logging.getLogger(__name__)
 
 def handle_esc_key(app):
     logger.info("ESC key pressed; returning to color selection")
-    if app.main_frame.isVisible():
+    if app.main_frame is not None and app.main_frame.isVisible():
         app.main_frame.hide()
+        move_depth_slider(app, app.depth_slider_slot)
         app.color_frame.show()
         app.color_indicator = None
         app.btn_play.setEnabled(False)
@@ -16,61 +19,27 @@ def handle_esc_key(app):
         app.auto_mode_check.setChecked(False)
         app.btn_play.setEnabled(True)
 
-def bind_shortcuts(app):
-    # ESC key - return to color selection
-    QShortcut(QKeySequence(Qt.Key.Key_Escape), app).activated.connect(
-        lambda: handle_esc_key(app) if app.color_indicator else None
-    )
-    
-    # Color selection shortcuts (W/B)
-    QShortcut(QKeySequence(Qt.Key.Key_W), app).activated.connect(
-        lambda: app.set_color('w')
-    )
-    QShortcut(QKeySequence(Qt.Key.Key_B), app).activated.connect(
-        lambda: app.set_color('b')
-    )
-    
-    # Move mode shortcuts (D/C) - only work before color selection
-    QShortcut(QKeySequence(Qt.Key.Key_D), app).activated.connect(
-        lambda: set_mode_shortcut(app, "drag") if app.color_indicator is None else None
-    )
-    QShortcut(QKeySequence(Qt.Key.Key_C), app).activated.connect(
-        lambda: set_mode_shortcut(app, "click") if app.color_indicator is None else None
-    )
-    
-    # Play move shortcut (P) - only after color selection
-    QShortcut(QKeySequence(Qt.Key.Key_P), app).activated.connect(
-        lambda: app.process_move_thread() if app.color_indicator else None
-    )
-    
-    # Auto mode toggle (A) - only after color selection
-    QShortcut(QKeySequence(Qt.Key.Key_A), app).activated.connect(
-        lambda: app.auto_mode_check.toggle() if app.color_indicator else None
-    )
-    
-    # Castling shortcuts (K/Q) - only after color selection
-    QShortcut(QKeySequence(Qt.Key.Key_K), app).activated.connect(
-        lambda: app.kingside_check.toggle() if app.color_indicator else None
-    )
-    QShortcut(QKeySequence(Qt.Key.Key_Q), app).activated.connect(
-        lambda: app.queenside_check.toggle() if app.color_indicator else None
-    )
-    
-    # Screenshot delay adjustment (Up/Down) - only before color selection
-    QShortcut(QKeySequence(Qt.Key.Key_Up), app).activated.connect(
-        lambda: adjust_delay_up(app) if app.color_indicator is None else None
-    )
-    QShortcut(QKeySequence(Qt.Key.Key_Down), app).activated.connect(
-        lambda: adjust_delay_down(app) if app.color_indicator is None else None
-    )
-    
-    # Depth adjustment (Right/Left) - always available
-    QShortcut(QKeySequence(Qt.Key.Key_Right), app).activated.connect(
-        lambda: adjust_depth_up(app)
-    )
-    QShortcut(QKeySequence(Qt.Key.Key_Left), app).activated.connect(
-        lambda: adjust_depth_down(app)
-    )
+def _when_color_chosen(handler, app, *args):
+    """Run handler only once a color has been selected."""
+    if app.color_indicator:
+        handler(app, *args)
+
+def _before_color_chosen(handler, app, *args):
+    """Run handler only on the color selection screen."""
+    if app.color_indicator is None:
+        handler(app, *args)
+
+def _always(handler, app, *args):
+    handler(app, *args)
+
+def _choose_color(app, color):
+    app.set_color(color)
+
+def _play_move(app):
+    app.process_move_thread()
+
+def _toggle_check(app, name):
+    getattr(app, name).toggle()
 
 def adjust_delay_up(app):
     current = app.screenshot_delay_var
@@ -112,4 +81,36 @@ def set_mode_shortcut(app, mode):
         elif mode == "click" and len(buttons) > 1:
             buttons[1].setChecked(True)  # Second button is click
     
-    logger.info(f"Move mode set to '{mode}' via shortcut")
\ No newline at end of file
+    logger.info(f"Move mode set to '{mode}' via shortcut")
+
+# (key sequence, gate, handler, extra args); the gate decides on which screen the key works
+_SHORTCUTS = tuple(
+    (QKeySequence(key), gate, handler, args)
+    for key, gate, handler, args in (
+        # ESC key - return to color selection
+        (Qt.Key.Key_Escape, _when_color_chosen, handle_esc_key, ()),
+        # Color selection shortcuts (W/B)
+        (Qt.Key.Key_W, _always, _choose_color, ('w',)),
+        (Qt.Key.Key_B, _always, _choose_color, ('b',)),
+        # Move mode shortcuts (D/C) - only work before color selection
+        (Qt.Key.Key_D, _before_color_chosen, set_mode_shortcut, ("drag",)),
+        (Qt.Key.Key_C, _before_color_chosen, set_mode_shortcut, ("click",)),
+        # Play move shortcut (P) - only after color selection
+        (Qt.Key.Key_P, _when_color_chosen, _play_move, ()),
+        # Auto mode toggle (A) - only after color selection
+        (Qt.Key.Key_A, _when_color_chosen, _toggle_check, ('auto_mode_check',)),
+        # Castling shortcuts (K/Q) - only after color selection
+        (Qt.Key.Key_K, _when_color_chosen, _toggle_check, ('kingside_check',)),
+        (Qt.Key.Key_Q, _when_color_chosen, _toggle_check, ('queenside_check',)),
+        # Screenshot delay adjustment (Up/Down) - only before color selection
+        (Qt.Key.Key_Up, _before_color_chosen, adjust_delay_up, ()),
+        (Qt.Key.Key_Down, _before_color_chosen, adjust_delay_down, ()),
+        # Depth adjustment (Right/Left) - always available
+        (Qt.Key.Key_Right, _always, adjust_depth_up, ()),
+        (Qt.Key.Key_Left, _always, adjust_depth_down, ()),
+    )
+)
+
+def bind_shortcuts(app):
+    for key_sequence, gate, handler, args in _SHORTCUTS:
+        QShortcut(key_sequence, app).activated.connect(partial(gate, handler, app, *args))
@@ -0,0 +1,317 @@
+import logging
+from functools import lru_cache
+from PyQt6.QtWidgets import QApplication
+
+logger = logging.getLogger(__name__)
+
+def build_qss(app):
+    """
+    Build the one stylesheet for the main window and the shortcuts dialog; widgets pick
+    their rules by object name.
+    Container rules (page, card, section) also cover their descendants and are ordered
+    outermost first so the inner ones win; widget rules use type + name selectors to
+    take precedence over them.
+    """
+    return _render_qss(app.accent_color, app.hover_color, app.text_color, app.bg_color, app.frame_color)
+
+def apply_stylesheet(app):
+    """
+    Install the stylesheet for app's palette, unless it is already installed;
+    setting it again would make Qt re-parse it and re-polish every widget.
+    """
+    qt_app = QApplication.instance()
+    qss = build_qss(app)
+    if qt_app.styleSheet() != qss:
+        qt_app.setStyleSheet(qss)
+
+@lru_cache(maxsize=8)
+def _render_qss(accent_color, hover_color, text_color, bg_color, frame_color):
+    logger.debug("Building application stylesheet")
+    return f"""
+        /* Containers */
+        #page, #page * {{
+            background-color: {bg_color};
+        }}
+        #card, #card * {{
+            background-color: {frame_color};
+            border-radius: 8px;
+        }}
+        #section, #section * {{
+            background-color: {frame_color};
+        }}
+
+        /* Labels */
+        QLabel#header {{
+            color: {accent_color};
+            font-family: 'Segoe UI';
+            font-size: 20pt;
+            font-weight: bold;
+        }}
+        QLabel#colorLabel {{
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 12pt;
+            font-weight: 500;
+        }}
+        QLabel#sectionTitle {{
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 11pt;
+            font-weight: 500;
+        }}
+        QLabel#depthLabel {{
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+        }}
+        QLabel#statusLabel {{
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+            background-color: #4a4a4a;
+            padding: 10px;
+            border-radius: 4px;
+        }}
+
+        /* Buttons */
+        QPushButton#colorBtn {{
+            background-color: {accent_color};
+            color: {text_color};
+            border: none;
+            border-radius: 5px;
+            font-family: 'Segoe UI';
+            font-size: 11pt;
+            font-weight: bold;
+            padding: 10px 20px;
+        }}
+        QPushButton#colorBtn:hover {{
+            background-color: {hover_color};
+        }}
+        QPushButton#colorBtn:pressed {{
+            background-color: #3d8b40;
+        }}
+        QPushButton#actionBtn {{
+            background-color: {accent_color};
+            color: {text_color};
+            border: none;
+            border-radius: 5px;
+            font-family: 'Segoe UI';
+            font-size: 12pt;
+            font-weight: bold;
+            padding: 12px;
+        }}
+        QPushButton#actionBtn:hover {{
+            background-color: {hover_color};
+        }}
+        QPushButton#actionBtn:pressed {{
+            background-color: #3d8b40;
+        }}
+        QPushButton#actionBtn:disabled {{
+            background-color: #5a5a5a;
+            color: #888888;
+        }}
+        QPushButton#shortcutsBtn {{
+            background-color: #4a4a4a;
+            color: {text_color};
+            border: 1px solid #5a5a5a;
+            border-radius: 4px;
+            font-family: 'Segoe UI';
+            font-size: 9pt;
+            font-weight: normal;
+            padding: 5px 10px;
+        }}
+        QPushButton#shortcutsBtn:hover {{
+            background-color: #525252;
+            border-color: {accent_color};
+        }}
+        QPushButton#shortcutsBtn:pressed {{
+            background-color: #3a3a3a;
+        }}
+        QPushButton#modeBtn {{
+            background-color: {accent_color};
+            color: {text_color};
+            border: none;
+            border-radius: 3px;
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+            font-weight: bold;
+            padding: 8px 15px;
+        }}
+        QPushButton#modeBtn:hover {{
+            background-color: {hover_color};
+        }}
+        QPushButton#modeBtn:pressed {{
+            background-color: {hover_color};
+        }}
+
+        /* Check and radio boxes */
+        QCheckBox#castleCheck {{
+            background-color: #4a4a4a;
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+            padding: 8px;
+            border-radius: 4px;
+        }}
+        QCheckBox#castleCheck:hover {{
+            background-color: #525252;
+        }}
+        QCheckBox#castleCheck::indicator {{
+            width: 16px;
+            height: 16px;
+        }}
+        QCheckBox#autoModeCheck {{
+            background-color: #4a4a4a;
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 11pt;
+            font-weight: 500;
+            padding: 10px;
+            border-radius: 4px;
+        }}
+        QCheckBox#autoModeCheck:hover {{
+            background-color: #525252;
+        }}
+        QCheckBox#autoModeCheck::indicator {{
+            width: 18px;
+            height: 18px;
+        }}
+        QRadioButton#modeRadio {{
+            background-color: #4a4a4a;
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+            padding: 8px 12px;
+            border-radius: 4px;
+        }}
+        QRadioButton#modeRadio:hover {{
+            background-color: #525252;
+        }}
+        QRadioButton#modeRadio::indicator {{
+            width: 16px;
+            height: 16px;
+        }}
+
+        /* Depth sliders */
+        QSlider#depthSlider::groove:horizontal {{
+            background: #4a4a4a;
+            height: 6px;
+            border-radius: 3px;
+        }}
+        QSlider#depthSlider::handle:horizontal {{
+            background: {accent_color};
+            width: 20px;
+            height: 20px;
+            margin: -7px 0;
+            border-radius: 10px;
+        }}
+        QSlider#depthSlider::handle:horizontal:hover {{
+            background: {hover_color};
+        }}
+
+        /* Screenshot delay */
+        QDoubleSpinBox#delaySpin {{
+            background-color: #4a4a4a;
+            color: {text_color};
+            border: 1px solid #5a5a5a;
+            border-radius: 4px;
+            padding: 5px 20px 5px 5px;
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+        }}
+        QDoubleSpinBox#delaySpin::up-button {{
+            subcontrol-origin: border;
+            subcontrol-position: top right;
+            width: 18px;
+            height: 15px;
+            background-color: {accent_color};
+            border-top-right-radius: 3px;
+            border-left: 1px solid #5a5a5a;
+        }}
+        QDoubleSpinBox#delaySpin::down-button {{
+            subcontrol-origin: border;
+            subcontrol-position: bottom right;
+            width: 18px;
+            height: 15px;
+            background-color: {accent_color};
+            border-bottom-right-radius: 3px;
+            border-left: 1px solid #5a5a5a;
+        }}
+        QDoubleSpinBox#delaySpin::up-button:hover {{
+            background-color: {hover_color};
+        }}
+        QDoubleSpinBox#delaySpin::down-button:hover {{
+            background-color: {hover_color};
+        }}
+        QDoubleSpinBox#delaySpin::up-arrow {{
+            image: none;
+            width: 0px;
+            height: 0px;
+            border-left: 4px solid transparent;
+            border-right: 4px solid transparent;
+            border-bottom: 5px solid {text_color};
+            margin: 0px 5px;
+        }}
+        QDoubleSpinBox#delaySpin::down-arrow {{
+            image: none;
+            width: 0px;
+            height: 0px;
+            border-left: 4px solid transparent;
+            border-right: 4px solid transparent;
+            border-top: 5px solid {text_color};
+            margin: 0px 5px;
+        }}
+
+        /* Shortcuts dialog */
+        #shortcutsDialog, #shortcutsDialog * {{
+            background-color: {bg_color};
+        }}
+        #shortcutsTable, #shortcutsTable * {{
+            background-color: {frame_color};
+            border-radius: 5px;
+        }}
+        QLabel#shortcutsTitle {{
+            color: {accent_color};
+            font-family: 'Segoe UI';
+            font-size: 16pt;
+            font-weight: bold;
+        }}
+        QLabel#shortcutsDescription {{
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+        }}
+        QLabel#shortcutsSection {{
+            color: {accent_color};
+            font-family: 'Segoe UI';
+            font-size: 11pt;
+            font-weight: bold;
+            margin-top: 10px;
+        }}
+        QLabel#shortcutsHeader, QLabel#shortcutsCell {{
+            color: {text_color};
+            font-family: 'Segoe UI';
+            font-size: 10pt;
+            padding: 8px;
+        }}
+        QLabel#shortcutsHeader {{
+            font-weight: bold;
+        }}
+        QLabel#shortcutsCell {{
+            border-radius: 0px;
+            border-bottom: 1px solid #4a4a4a;
+        }}
+        QPushButton#shortcutsClose {{
+            background-color: {accent_color};
+            color: {text_color};
+            border: none;
+            border-radius: 5px;
+            font-family: 'Segoe UI';
+            font-size: 11pt;
+            font-weight: bold;
+            padding: 10px 20px;
+        }}
+        QPushButton#shortcutsClose:hover {{
+            background-color: {hover_color};
+        }}
+    """
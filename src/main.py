@@ -17,7 +17,7 @@ if __name__ == "__main__":
     multiprocessing.freeze_support()
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QMessageBox
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
 
 from utils.logging_setup import setup_console_logging
 from utils.chess_resources_manager import setup_resources
@@ -58,7 +58,7 @@ from game import MoveExecutor, BoardAnalyzer, MoveValidator, AutoPlayController
 from services import EngineService
 
 from gui.set_window_icon import set_window_icon
-from gui.create_widget import create_widgets
+from gui.create_widget import create_widgets, ensure_main_frame, update_depth_labels, move_depth_slider
 from gui.shortcuts import bind_shortcuts
 from gui.button_and_checkboxes import (
     color_button,
@@ -91,6 +91,9 @@ class ChessPilot(QMainWindow):
         self.auto_mode_var = False
         self.board_positions = {}
 
+        # Set on close so worker threads waiting on the board can bail out
+        self._stop_event = threading.Event()
+
         self.screenshot_delay_var = AppConfig.DEFAULT_SCREENSHOT_DELAY
         self.move_mode = AppConfig.DEFAULT_MOVE_MODE
 
@@ -136,14 +139,36 @@ class ChessPilot(QMainWindow):
     def create_shortcuts_button(self, parent, command):
         return shortcuts_button(self, parent, command)
 
+    @pyqtSlot(int)
+    def on_kingside_changed(self, state):
+        self.kingside_var = state == Qt.CheckState.Checked.value
+
+    @pyqtSlot(int)
+    def on_queenside_changed(self, state):
+        self.queenside_var = state == Qt.CheckState.Checked.value
+
+    @pyqtSlot(int)
+    def on_auto_mode_changed(self, state):
+        self.auto_mode_var = state == Qt.CheckState.Checked.value
+        self.toggle_auto_mode()
+
+    @pyqtSlot(int)
+    def on_depth_changed(self, value):
+        update_depth_labels(self, value)
+
+    @pyqtSlot(str)
     def set_color(self, color):
         logger.info(f"Color selected: {'White' if color == 'w' else 'Black'}")
         self.color_indicator = color
+        self.engine_service.new_game()
         self.color_frame.hide()
+        ensure_main_frame(self)
+        move_depth_slider(self, self.depth_slider_slot_main)
         self.main_frame.show()
         self.btn_play.setEnabled(True)
         self.update_status(f"\nPlaying as {'White' if color == 'w' else 'Black'}")
 
+    @pyqtSlot(str)
     def set_move_mode(self, mode):
         logger.info(f"Move method set to: {mode}")
         self.move_mode = mode
@@ -151,9 +176,12 @@ class ChessPilot(QMainWindow):
 
     def update_status(self, message):
         logger.debug(f"Status update: {message.strip()}")
-        self.status_label.setText(message)
+        # The status label lives on the play page, which doesn't exist before a color is chosen
+        if self.main_frame is not None:
+            self.status_label.setText(message)
         self.depth_label.setText(f"Depth: {self.depth_var}")
 
+    @pyqtSlot()
     def process_move_thread(self):
         logger.info("Play Next Move button pressed; starting process_move thread")
         threading.Thread(
@@ -175,6 +203,7 @@ class ChessPilot(QMainWindow):
             daemon=True,
         ).start()
 
+    @pyqtSlot()
     def toggle_auto_mode(self):
         if self.auto_mode_var:
             logger.info("Auto mode enabled")
@@ -270,6 +299,7 @@ class ChessPilot(QMainWindow):
 
     def closeEvent(self, event):
         logger.info("Application closing - cleaning up Stockfish process")
+        self._stop_event.set()
         self.engine_service.cleanup()
         event.accept()
 
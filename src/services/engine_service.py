@@ -2,7 +2,8 @@ import logging
 from executor.get_best_move import (
     get_best_move,
     initialize_stockfish_at_startup,
-    cleanup_stockfish
+    cleanup_stockfish,
+    reset_engine
 )
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,11 @@ class EngineService:
         logger.info("Cleaning up engine service")
         cleanup_stockfish()
 
+    @staticmethod
+    def new_game():
+        logger.info("Resetting engine for a new game")
+        reset_engine()
+
     @staticmethod
     def get_best_move(depth: int, fen: str, root=None, auto_mode_var=None):
         logger.debug(f"Querying best move for FEN: {fen} at depth {depth}")